@@ -1,10 +1,19 @@
 """Tkinter-based Action Menu prototype with persistence and journaling."""
 from __future__ import annotations
 
+from collections import defaultdict
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Callable, Dict, List
+from operator import attrgetter
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Sequence, Tuple, TypeVar
+import bisect
+import heapq
+import itertools
+import re
+import sys
+import time
 import tkinter as tk
-from tkinter import messagebox, simpledialog, ttk
+from tkinter import messagebox, ttk
 
 from models import (
     FlowLog,
@@ -14,11 +23,12 @@ from models import (
     QuickCaptureItem,
     SmartGoal,
     TimeEntry,
+    utc_now,
 )
-from storage import StorageManager, get_default_store_path
-from journal_ai import extract_suggestions
-from ui.flow_dialog import FlowCaptureDialog
-from ui.tooltips import Tooltip
+from storage import PersistenceWriter, StorageManager, get_default_store_path
+from ui.tooltips import TooltipManager
+from ui.virtual_list import VirtualListbox
+from ui.virtual_tree import VirtualTreeview
 from ui.constants import (
     ACTION_SAMPLE,
     CATEGORY_COLORS,
@@ -32,7 +42,101 @@ from ui.constants import (
 )
 from ui import tabs as tab_builders
 
+if TYPE_CHECKING:
+    from concurrent.futures import Future, ThreadPoolExecutor
+
+    from ui.flow_dialog import FlowCaptureDialog
+
 QUICK_CAPTURE_STATUSES = ["Inbox", "Today", "Later", "Archived"]
+JOURNAL_SUGGEST_DELAY_MS = 300
+PERSIST_DELAY_MS = 500
+SUGGEST_POLL_MS = 20
+HISTORY_PAGE_SIZE = 200
+_MONTH_ABBREVIATIONS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+# Lowercase token -> journal tag; a token anywhere in the text (even mid-word) applies the tag.
+_TAG_TOKENS: Dict[str, str] = {
+    **{category.lower(): category for category in CATEGORY_OPTIONS},
+    "rest": "Recovery",
+    "recover": "Recovery",
+}
+# Lookahead so overlapping tokens are all found in one scan; longest first so "recovery" beats "recover".
+# Case-insensitive so the journal text is scanned as-is instead of lowered into a second copy first.
+# Each token has its own group and the tag comes from lastindex, never from the matched text: case
+# folding also matches spellings such as "reſt" whose lower() is not a key of _TAG_TOKENS.
+_TAG_ORDER = tuple(sorted(_TAG_TOKENS, key=len, reverse=True))
+_TAG_PATTERN = re.compile(
+    "(?=(?:" + "|".join(f"({re.escape(token)})" for token in _TAG_ORDER) + "))",
+    re.IGNORECASE,
+)
+_TAG_BY_GROUP = (None, *(_TAG_TOKENS[token] for token in _TAG_ORDER))
+T = TypeVar("T")
+_item_id = attrgetter("id")
+_created_at = attrgetter("created_at")
+# One ttk::style configure call per style name; add options here rather than extra configure calls.
+_STYLE_SPEC: Dict[str, Dict[str, object]] = {
+    "Header.TLabel": {"font": ("Segoe UI", 20, "bold")},
+    "Subheader.TLabel": {"font": ("Segoe UI", 12)},
+    "Card.TLabelframe": {"padding": 12},
+    "Card.TLabelframe.Label": {"font": ("Segoe UI", 12, "bold")},
+    "Accent.TButton": {"padding": 6},
+}
+# Validation/confirmation dialogs shown via ActionMenuApp._warn/_inform: key -> (title, message).
+_MESSAGES: Dict[str, Tuple[str, str]] = {
+    "intentions_locked": ("Intentions locked", "Great! These reflections fuel the rest of the menu."),
+    "missing_title": ("Missing title", "Give the goal a clear title."),
+    "missing_habit": ("Missing habit", "Name the habit to remember it later."),
+    "missing_action": ("Missing action", "Describe the move you want to make."),
+    "today_empty": ("Action Menu", "Add at least one action to the Today bucket first."),
+    "missing_category": ("Time & Flow", "Name the category before adding it."),
+    "duplicate_category": ("Time & Flow", "That category already exists."),
+    "timer_running": ("Action Menu", "Timer already running. Stop it before starting a new block."),
+    "timer_missing_activity": ("Need activity", "Describe the experiment or task before starting the timer."),
+    "timer_idle": ("Action Menu", "Start the timer first."),
+    "manual_missing_activity": ("Need activity", "Fill in the activity field before logging manually."),
+    "journal_empty": ("Journal", "Write something before saving."),
+    "select_suggestion": ("Journal", "Select a suggestion first."),
+    "suggestion_to_today": ("Journal", "Added suggestion to Today focus."),
+    "suggestion_to_goal": ("Journal", "Drafted the text into the goal title field."),
+    "suggestion_to_habit": ("Journal", "Drafted the text into the habit name field."),
+    "suggestion_to_capture": ("Journal", "Captured suggestion into the Inbox."),
+    "quick_empty": ("Quick capture", "Drop a thought before hitting capture."),
+    "quick_select_many": ("Quick capture", "Select one or more items first."),
+    "quick_select_delete": ("Quick capture", "Select an item to delete."),
+    "quick_select_edit": ("Quick capture", "Select an item to edit."),
+    "quick_missing_item": ("Quick capture", "Unable to locate that item."),
+    "quick_blank_text": ("Quick capture", "Text cannot be empty."),
+    "calendar_mock": (
+        "Integrations",
+        "Pretending to connect to Google Calendar. Future builds will detect conflicts and sync colors.",
+    ),
+}
+# (key, label, builder, hydrator method name) — tabs are built and hydrated on first visit.
+NOTEBOOK_TABS: Tuple[Tuple[str, str, Callable[..., ttk.Frame], str | None], ...] = (
+    ("vision", "North Star", tab_builders.build_vision_tab, "_hydrate_reflections"),
+    ("goals", "SMART Goals", tab_builders.build_goals_tab, "_refresh_goal_tree"),
+    ("habits", "Habits & Actions", tab_builders.build_habits_tab, "_hydrate_habits_tab"),
+    ("weekly", "Weekly Menu", tab_builders.build_weekly_tab, "_hydrate_weekly_tab"),
+    ("time", "Time & Flow", tab_builders.build_time_tab, "_hydrate_time_tab"),
+    ("journal", "Journal", tab_builders.build_journal_tab, "_hydrate_journal_tab"),
+    ("quick", "Quick Capture", tab_builders.build_quick_capture_tab, "_refresh_quick_capture_tree"),
+    ("integrations", "Integrations", tab_builders.build_integrations_tab, None),
+)
+
+
+@dataclass(slots=True)
+class FlowContext:
+    """Pre-block snapshot carried from the timer into the flow capture dialog."""
+
+    activity: str
+    category: str
+    flow_before: int
+    emotion_before: str
+
+
+def _infer_tags(text: str) -> List[str]:
+    found = {_TAG_BY_GROUP[match.lastindex] for match in _TAG_PATTERN.finditer(text)}
+    # Every tag is a category (Recovery included), so the option list already gives a canonical order.
+    return [category for category in CATEGORY_OPTIONS if category in found]
 
 
 class ActionMenuApp(tk.Tk):
@@ -45,18 +149,55 @@ class ActionMenuApp(tk.Tk):
         store_path = get_default_store_path()
         self.storage = StorageManager(store_path)
         self.state = self.storage.load()
+        self._writer = PersistenceWriter(self.storage)
+        self._dirty = False
+        self._flush_after_id: str | None = None
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
         if not self.state.timer_categories:
             self.state.timer_categories = list(DEFAULT_TIMER_CATEGORIES)
 
         self.timer_start: datetime | None = None
-        self.pending_flow_context: Dict[str, int | str] | None = None
+        self.pending_flow_context: FlowContext | None = None
         self.current_suggestions: List[JournalSuggestion] = []
-        self.flow_dialog: tk.Toplevel | None = None
-        self._tooltips: List[Tooltip] = []
+        self._suggest_after_id: str | None = None
+        self._suggested_text: str | None = None
+        self._shown_suggestion_labels: Tuple[str, ...] | None = None
+        self._suggest_future: Future[List[JournalSuggestion]] | None = None
+        self._journal_select_after_id: str | None = None
+        self._journal_detail_text = ""
+        self._nlp_pool: ThreadPoolExecutor | None = None
+        self.flow_dialog: FlowCaptureDialog | None = None
+        self._tooltips = TooltipManager(self)
+        # Journal entries stay sorted oldest-first so history can be listed without re-sorting.
+        self.state.journal_entries.sort(key=_created_at)
+        self._journal_by_id: Dict[str, JournalEntry] = {entry.id: entry for entry in self.state.journal_entries}
+        self._quick_by_id: Dict[str, QuickCaptureItem] = {item.id: item for item in self.state.quick_capture}
+        self._time_entry_by_id: Dict[str, TimeEntry] = {entry.id: entry for entry in self.state.time_entries}
+        self._goal_titles: List[str] = [goal.title for goal in self.state.goals]
+        self._habit_names: List[str] = [habit.name for habit in self.state.habits]
+        self._last_habit_goal_values: Tuple[str, ...] = ()
+        self._last_motivation_values: Tuple[str, ...] = ()
+        self._last_action_labels: Tuple[str, ...] | None = None
+        self._category_totals: defaultdict[str, float] = defaultdict(float)
+        self._totaled_entries = 0
+        self._last_effort_summary = ""
+        self._flow_before_sum = 0
+        self._flow_after_sum = 0
+        # Display rows for records that never change after creation (time entries, journal entries), by id.
+        self._row_cache: Dict[str, Tuple[object, ...]] = {}
+        # Stored timestamps never change, so each is converted to local time and formatted once.
+        self._local_labels: Dict[datetime, str] = {}
+        self._time_page_limit = HISTORY_PAGE_SIZE
+        self._journal_page_limit = HISTORY_PAGE_SIZE
+        self._pending: List[Tuple[float, int, Callable[[], None]]] = []
+        self._pending_seq = itertools.count()
+        self._pump_after_id: str | None = None
+        self._tab_frames: Dict[str, ttk.Frame] = {}
+        self._built_tabs: set[str] = set()
+        self._bucket_targets: Dict[str, Tuple[List[str], VirtualListbox]] = {}
 
         self._build_style()
         self._build_layout()
-        self._hydrate_all()
 
     # region build layout
     def _bind_submit(self, widget: tk.Widget, handler: Callable[[], None]) -> None:
@@ -68,11 +209,8 @@ class ActionMenuApp(tk.Tk):
 
     def _build_style(self) -> None:
         style = ttk.Style(self)
-        style.configure("Header.TLabel", font=("Segoe UI", 20, "bold"))
-        style.configure("Subheader.TLabel", font=("Segoe UI", 12))
-        style.configure("Card.TLabelframe", padding=12)
-        style.configure("Card.TLabelframe.Label", font=("Segoe UI", 12, "bold"))
-        style.configure("Accent.TButton", padding=6)
+        for name, options in _STYLE_SPEC.items():
+            style.configure(name, **options)
 
     def _build_layout(self) -> None:
         header = ttk.Frame(self, padding=20)
@@ -89,87 +227,185 @@ class ActionMenuApp(tk.Tk):
             justify=tk.LEFT,
         ).pack(anchor=tk.W, pady=(6, 0))
 
-        notebook = ttk.Notebook(self)
-        notebook.pack(fill=tk.BOTH, expand=True, padx=20, pady=(0, 20))
+        self.notebook = ttk.Notebook(self)
+        self.notebook.pack(fill=tk.BOTH, expand=True, padx=20, pady=(0, 20))
+
+        for key, label, _builder, _hydrator in NOTEBOOK_TABS:
+            placeholder = ttk.Frame(self.notebook)
+            self.notebook.add(placeholder, text=label)
+            self._tab_frames[key] = placeholder
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+        self._ensure_tab_built(NOTEBOOK_TABS[0][0])
+
+    def _on_tab_changed(self, _event: tk.Event) -> None:
+        self._ensure_tab_built(NOTEBOOK_TABS[self.notebook.index("current")][0])
+
+    def _ensure_tab_built(self, key: str) -> None:
+        if key in self._built_tabs:
+            return
+        self._built_tabs.add(key)
+        _key, _label, builder, hydrator = next(spec for spec in NOTEBOOK_TABS if spec[0] == key)
+        builder(self, self._tab_frames[key]).pack(fill=tk.BOTH, expand=True)
+        if hydrator:
+            getattr(self, hydrator)()
+
+    def _require(self, var: tk.StringVar, message_key: str) -> str | None:
+        """Return the stripped value of a required field, or warn and return None when it is blank."""
+        value = var.get().strip()
+        if not value:
+            self._warn(message_key)
+            return None
+        return value
+
+    def _warn(self, key: str) -> None:
+        title, message = _MESSAGES[key]
+        messagebox.showwarning(title, message)
 
-        notebook.add(tab_builders.build_vision_tab(self, notebook), text="North Star")
-        notebook.add(tab_builders.build_goals_tab(self, notebook), text="SMART Goals")
-        notebook.add(tab_builders.build_habits_tab(self, notebook), text="Habits & Actions")
-        notebook.add(tab_builders.build_weekly_tab(self, notebook), text="Weekly Menu")
-        notebook.add(tab_builders.build_time_tab(self, notebook), text="Time & Flow")
-        notebook.add(tab_builders.build_journal_tab(self, notebook), text="Journal")
-        notebook.add(tab_builders.build_quick_capture_tab(self, notebook), text="Quick Capture")
-        notebook.add(tab_builders.build_integrations_tab(self, notebook), text="Integrations")
+    def _inform(self, key: str) -> None:
+        title, message = _MESSAGES[key]
+        messagebox.showinfo(title, message)
 
     def _attach_tooltip(self, widget: tk.Widget, text: str) -> None:
-        self._tooltips.append(Tooltip(widget, text))
+        self._tooltips.attach(widget, text)
 
     # endregion build layout
 
+    # region scheduling
+    def _schedule(self, callback: Callable[[], None], delay_ms: float) -> None:
+        deadline = time.monotonic() + delay_ms / 1000
+        heapq.heappush(self._pending, (deadline, next(self._pending_seq), callback))
+        if self._pending[0][0] == deadline:
+            self._arm_pump()
+
+    def _arm_pump(self) -> None:
+        # One Tk timer armed for the earliest deadline instead of a fixed polling tick.
+        if self._pump_after_id is not None:
+            self.after_cancel(self._pump_after_id)
+            self._pump_after_id = None
+        if not self._pending:
+            return
+        delay = max(1, int((self._pending[0][0] - time.monotonic()) * 1000))
+        self._pump_after_id = self.after(delay, self._pump)
+
+    def _pump(self) -> None:
+        self._pump_after_id = None
+        now = time.monotonic()
+        # Re-arm even if a callback raises; otherwise every later deadline (timer tick, suggestion
+        # polling) would silently never fire. The exception still reaches Tk's error reporting.
+        try:
+            while self._pending and self._pending[0][0] <= now:
+                _, _, callback = heapq.heappop(self._pending)
+                callback()
+        finally:
+            self._arm_pump()
+
+    # endregion scheduling
+
     # region hydration
-    def _hydrate_all(self) -> None:
-        self._hydrate_reflections()
-        self._refresh_goal_tree()
+    def _hydrate_habits_tab(self) -> None:
         self._refresh_habit_tree()
+        self._refresh_goal_dependent_controls()
+
+    def _hydrate_weekly_tab(self) -> None:
+        self._bucket_targets = {
+            sys.intern(bucket): (self.state.weekly_actions.setdefault(bucket, []), listbox)
+            for bucket, listbox in self.week_lists.items()
+        }
         self._refresh_weekly_lists()
         self._refresh_goal_dependent_controls()
+
+    def _hydrate_time_tab(self) -> None:
+        self._refresh_timer_category_choices()
         self._refresh_time_tree()
         self._refresh_flow_logs()
-        self._refresh_quick_capture_tree()
+
+    def _hydrate_journal_tab(self) -> None:
+        self._update_journal_suggestions()
         self._refresh_journal_history()
 
     def _format_local(self, value: datetime) -> str:
-        if value.tzinfo is None:
-            value = value.replace(tzinfo=timezone.utc)
-        return value.astimezone().strftime("%b %d %H:%M")
+        label = self._local_labels.get(value)
+        if label is None:
+            local = (value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value).astimezone()
+            # Same text as strftime("%b %d %H:%M") in the C locale, without re-parsing the format per row.
+            label = f"{_MONTH_ABBREVIATIONS[local.month - 1]} {local.day:02d} {local.hour:02d}:{local.minute:02d}"
+            self._local_labels[value] = label
+        return label
 
     def _hydrate_reflections(self) -> None:
-        self.values_text.delete("1.0", tk.END)
-        self.milestones_text.delete("1.0", tk.END)
-        self.energy_text.delete("1.0", tk.END)
-        self.values_text.insert(tk.END, self.state.reflections.values)
-        self.milestones_text.insert(tk.END, self.state.reflections.milestones)
-        self.energy_text.insert(tk.END, self.state.reflections.energy)
+        self._set_text(self.values_text, self.state.reflections.values)
+        self._set_text(self.milestones_text, self.state.reflections.milestones)
+        self._set_text(self.energy_text, self.state.reflections.energy)
+
+    def _set_text(self, widget: tk.Text, value: str) -> None:
+        # One read is cheaper than rewriting when the buffer already matches; otherwise one replace
+        # swaps the content in a single Tcl command instead of delete + insert.
+        if widget.get("1.0", "end-1c") == value:
+            return
+        widget.replace("1.0", tk.END, value)
+
+    def _sync_tree(
+        self,
+        view: VirtualTreeview,
+        items: Iterable[T],
+        key_fn: Callable[[T], str],
+        values_fn: Callable[[T], Tuple[object, ...]],
+    ) -> None:
+        # The view diffs against what Tk already shows, so only changed rows cost a Tcl call.
+        view.set_rows((key_fn(item), values_fn(item)) for item in items)
 
     def _refresh_goal_tree(self) -> None:
-        self.goal_tree.delete(*self.goal_tree.get_children())
-        for goal in self.state.goals:
-            measure = goal.measurable or goal.time_bound
-            self.goal_tree.insert(
-                "",
-                tk.END,
-                iid=goal.id,
-                values=(goal.title, goal.category, goal.horizon, measure),
-            )
+        self._sync_tree(self.goal_view, self.state.goals, _item_id, self._goal_row)
+
+    def _goal_row(self, goal: SmartGoal) -> Tuple[object, ...]:
+        return (goal.title, goal.category, goal.horizon, goal.measurable or goal.time_bound)
+
+    def _insert_goal_row(self, goal: SmartGoal) -> None:
+        self.goal_view.insert(tk.END, goal.id, self._goal_row(goal))
 
     def _refresh_habit_tree(self) -> None:
-        self.habit_tree.delete(*self.habit_tree.get_children())
-        for habit in self.state.habits:
-            self.habit_tree.insert(
-                "",
-                tk.END,
-                iid=habit.id,
-                values=(habit.name, habit.frequency, habit.anchor, habit.linked_goal),
-            )
-        self.action_list.delete(0, tk.END)
-        for habit in self.state.habits:
-            label = f"{habit.name} → {habit.success_metric or 'track completion'}"
-            self.action_list.insert(tk.END, label)
+        self._sync_tree(self.habit_view, self.state.habits, _item_id, self._habit_row)
+        # Like the trees, the action list is only rewritten when its contents actually change.
+        labels = tuple(self._habit_action_label(habit) for habit in self.state.habits)
+        if labels != self._last_action_labels:
+            self._bulk_fill_listbox(self.action_list, labels)
+            self._last_action_labels = labels
+
+    def _habit_row(self, habit: HabitPlan) -> Tuple[object, ...]:
+        return (habit.name, habit.frequency, habit.anchor, habit.linked_goal)
+
+    def _insert_habit_row(self, habit: HabitPlan) -> None:
+        self.habit_view.insert(tk.END, habit.id, self._habit_row(habit))
+
+    def _habit_action_label(self, habit: HabitPlan) -> str:
+        return f"{habit.name} → {habit.success_metric or 'track completion'}"
+
+    def _bulk_fill_listbox(self, listbox: tk.Listbox, items: Sequence[str]) -> None:
+        # A single varargs insert is one Tcl command instead of one per item.
+        listbox.delete(0, tk.END)
+        if items:
+            listbox.insert(tk.END, *items)
 
     def _refresh_weekly_lists(self) -> None:
+        if not hasattr(self, "week_lists"):
+            return
+        buckets = self.state.weekly_actions
         for bucket, listbox in self.week_lists.items():
-            listbox.delete(0, tk.END)
-            for action in self.state.weekly_actions.get(bucket, []):
-                listbox.insert(tk.END, action)
-        self.today_focus.delete(0, tk.END)
-        for action in self.state.weekly_actions.get("Today", [])[:3]:
-            self.today_focus.insert(tk.END, action)
+            listbox.set_items(buckets.get(bucket, ()))
+        self._bulk_fill_listbox(self.today_focus, buckets.get("Today", [])[:3])
 
     def _refresh_goal_dependent_controls(self) -> None:
-        goal_titles = [goal.title for goal in self.state.goals]
-        self.habit_goal.configure(values=goal_titles)
-        motivation_options = goal_titles + [habit.name for habit in self.state.habits]
-        self.action_motivation.configure(values=motivation_options)
+        # Title/name caches are appended in _add_goal/_add_habit; skip the Tk configure when nothing changed.
+        if hasattr(self, "habit_goal"):
+            habit_goal_values = tuple(self._goal_titles)
+            if habit_goal_values != self._last_habit_goal_values:
+                self.habit_goal.configure(values=habit_goal_values)
+                self._last_habit_goal_values = habit_goal_values
+        if hasattr(self, "action_motivation"):
+            motivation_values = (*self._goal_titles, *self._habit_names)
+            if motivation_values != self._last_motivation_values:
+                self.action_motivation.configure(values=motivation_values)
+                self._last_motivation_values = motivation_values
         self._refresh_timer_category_choices()
 
     def _refresh_timer_category_choices(self) -> None:
@@ -180,77 +416,134 @@ class ActionMenuApp(tk.Tk):
             self.timer_category.set(self.state.timer_categories[0])
 
     def _refresh_time_tree(self) -> None:
-        self.time_tree.delete(*self.time_tree.get_children())
-        for entry in self.state.time_entries:
-            self.time_tree.insert(
-                "",
-                tk.END,
-                iid=entry.id,
-                values=(
-                    entry.activity,
-                    entry.category,
-                    self._format_local(entry.start),
-                    f"{entry.duration_hours:.2f}",
-                    entry.calendar_color,
-                ),
+        # Time entries are append-only and each new one is added as it is recorded, so the totals
+        # only need a full pass when they have not seen every entry yet.
+        if self._totaled_entries != len(self.state.time_entries):
+            self._category_totals = defaultdict(float)
+            self._totaled_entries = 0
+            for entry in self.state.time_entries:
+                self._add_to_category_totals(entry)
+        # Totals cover the whole history; only the newest page of rows is listed.
+        recent = self.state.time_entries[-self._time_page_limit :]
+        self._sync_tree(self.time_view, recent, _item_id, self._time_row)
+        self._update_older_button(self.time_older_button, self._time_page_limit, self.state.time_entries)
+        self._emit_effort_summary()
+
+    def _load_older_time_entries(self) -> None:
+        self._time_page_limit += HISTORY_PAGE_SIZE
+        self._refresh_time_tree()
+
+    def _time_row(self, entry: TimeEntry) -> Tuple[object, ...]:
+        row = self._row_cache.get(entry.id)
+        if row is None:
+            row = self._row_cache[entry.id] = (
+                entry.activity,
+                entry.category,
+                self._format_local(entry.start),
+                f"{entry.duration_hours:.2f}",
+                entry.calendar_color,
             )
-        self._refresh_effort_summary()
+        return row
+
+    def _insert_time_row(self, entry: TimeEntry) -> None:
+        self.time_view.insert(tk.END, entry.id, self._time_row(entry))
+        self._trim_history_page(
+            self.time_view, self.time_older_button, self.state.time_entries, self._time_page_limit
+        )
+
+    def _trim_history_page(
+        self,
+        view: VirtualTreeview,
+        older_button: ttk.Button,
+        entries: Sequence[TimeEntry | JournalEntry],
+        limit: int,
+    ) -> None:
+        # Keeps an incremental insert inside the page. Entries are oldest-first, so the one just past
+        # the page is the row the insert pushed off it.
+        if len(entries) > limit:
+            view.remove((entries[-limit - 1].id,))
+        self._update_older_button(older_button, limit, entries)
+
+    def _update_older_button(self, button: ttk.Button, limit: int, entries: Sequence[object]) -> None:
+        button.state(["disabled"] if limit >= len(entries) else ["!disabled"])
 
     def _refresh_flow_logs(self) -> None:
-        self.flow_log_tree.delete(*self.flow_log_tree.get_children())
+        self._flow_before_sum = 0
+        self._flow_after_sum = 0
+        # Bound once: this loop runs per flow log on every refresh.
+        related_entry = self._time_entry_by_id.get
+        flow_row = self._flow_row
+        add_to_sums = self._add_to_flow_sums
+        rows = []
         for log in self.state.flow_logs:
-            related = next((entry for entry in self.state.time_entries if entry.id == log.time_entry_id), None)
+            related = related_entry(log.time_entry_id)
             activity = related.activity if related else "Session"
-            self.flow_log_tree.insert(
-                "",
-                tk.END,
-                values=(
-                    activity,
-                    log.flow_before,
-                    log.flow_after,
-                    log.emotion_after,
-                    self._format_local(log.created_at),
-                ),
-            )
-        if not self.state.flow_logs:
+            rows.append((log.id, flow_row(log, activity)))
+            add_to_sums(log)
+        self.flow_log_view.set_rows(rows)
+        self._emit_flow_summary()
+
+    def _flow_row(self, log: FlowLog, activity: str) -> Tuple[object, ...]:
+        return (
+            activity,
+            log.flow_before,
+            log.flow_after,
+            log.emotion_after,
+            self._format_local(log.created_at),
+        )
+
+    def _add_to_flow_sums(self, log: FlowLog) -> None:
+        self._flow_before_sum += log.flow_before
+        self._flow_after_sum += log.flow_after
+
+    def _emit_flow_summary(self) -> None:
+        count = len(self.state.flow_logs)
+        if not count:
             self.flow_summary.set("Flow data pending first log.")
             return
-        avg_before = sum(log.flow_before for log in self.state.flow_logs) / len(self.state.flow_logs)
-        avg_after = sum(log.flow_after for log in self.state.flow_logs) / len(self.state.flow_logs)
+        avg_before = self._flow_before_sum / count
+        avg_after = self._flow_after_sum / count
         self.flow_summary.set(
             f"Average flow {avg_before:.1f} → {avg_after:.1f}. Capture feelings to spot trends."
         )
 
-    def _refresh_effort_summary(self) -> None:
-        if not self.state.time_entries:
-            self.effort_summary.set("No hours tracked yet.")
-            return
-        totals: Dict[str, float] = {}
-        for entry in self.state.time_entries:
-            totals[entry.category] = totals.get(entry.category, 0) + entry.duration_hours
-        breakdown = ", ".join(f"{cat}: {hours:.2f}h" for cat, hours in totals.items())
-        self.effort_summary.set(f"Effort invested → {breakdown}")
+    def _add_to_category_totals(self, entry: TimeEntry) -> None:
+        self._category_totals[entry.category] += entry.duration_hours
+        self._totaled_entries += 1
+
+    def _emit_effort_summary(self) -> None:
+        if self._category_totals:
+            breakdown = ", ".join(f"{cat}: {hours:.2f}h" for cat, hours in self._category_totals.items())
+            summary = f"Effort invested → {breakdown}"
+        else:
+            summary = "No hours tracked yet."
+        if summary != self._last_effort_summary:
+            self.effort_summary.set(summary)
+            self._last_effort_summary = summary
 
     def _refresh_quick_capture_tree(self) -> None:
-        self.quick_tree.delete(*self.quick_tree.get_children())
-        for item in self.state.quick_capture:
-            self.quick_tree.insert(
-                "",
-                tk.END,
-                iid=item.id,
-                values=(item.text, item.status, self._format_local(item.created_at)),
-            )
+        if not hasattr(self, "quick_view"):
+            return
+        self._sync_tree(self.quick_view, self.state.quick_capture, _item_id, self._quick_row)
+
+    def _quick_row(self, item: QuickCaptureItem) -> Tuple[object, ...]:
+        return (item.text, item.status, self._format_local(item.created_at))
 
     def _refresh_journal_history(self) -> None:
-        self.journal_history.delete(*self.journal_history.get_children())
-        for entry in sorted(self.state.journal_entries, key=lambda e: e.created_at, reverse=True):
+        newest = itertools.islice(reversed(self.state.journal_entries), self._journal_page_limit)
+        self._sync_tree(self.journal_view, newest, _item_id, self._journal_row)
+        self._update_older_button(self.journal_older_button, self._journal_page_limit, self.state.journal_entries)
+
+    def _load_older_journal_entries(self) -> None:
+        self._journal_page_limit += HISTORY_PAGE_SIZE
+        self._refresh_journal_history()
+
+    def _journal_row(self, entry: JournalEntry) -> Tuple[object, ...]:
+        row = self._row_cache.get(entry.id)
+        if row is None:
             excerpt = (entry.text[:60] + "…") if len(entry.text) > 60 else entry.text
-            self.journal_history.insert(
-                "",
-                tk.END,
-                iid=entry.id,
-                values=(self._format_local(entry.created_at), excerpt),
-            )
+            row = self._row_cache[entry.id] = (self._format_local(entry.created_at), excerpt)
+        return row
 
     # endregion hydration
 
@@ -260,13 +553,12 @@ class ActionMenuApp(tk.Tk):
         reflections.values = self.values_text.get("1.0", tk.END).strip()
         reflections.milestones = self.milestones_text.get("1.0", tk.END).strip()
         reflections.energy = self.energy_text.get("1.0", tk.END).strip()
-        self._persist()
-        messagebox.showinfo("Intentions locked", "Great! These reflections fuel the rest of the menu.")
+        self._schedule_persist()
+        self._inform("intentions_locked")
 
     def _add_goal(self) -> None:
-        title = self.goal_vars["title"].get().strip()
-        if not title:
-            messagebox.showwarning("Missing title", "Give the goal a clear title.")
+        title = self._require(self.goal_vars["title"], "missing_title")
+        if title is None:
             return
         category = self.goal_category.get() or "General"
         goal = SmartGoal.new(
@@ -281,116 +573,137 @@ class ActionMenuApp(tk.Tk):
             calendar_color=CATEGORY_COLORS.get(category, "default"),
         )
         self.state.goals.append(goal)
-        self._persist()
-        self._refresh_goal_tree()
+        self._goal_titles.append(goal.title)
+        self._schedule_persist()
+        self._insert_goal_row(goal)
         self._refresh_goal_dependent_controls()
-        for entry in self.goal_vars.values():
-            entry.delete(0, tk.END)
+        for var in self.goal_vars.values():
+            var.set("")
 
     def _add_habit(self) -> None:
-        name = self.habit_entries["name"].get().strip()
-        if not name:
-            messagebox.showwarning("Missing habit", "Name the habit to remember it later.")
+        name = self._require(self.habit_vars["name"], "missing_habit")
+        if name is None:
             return
         habit = HabitPlan.new(
             name=name,
-            anchor=self.habit_entries["anchor"].get().strip(),
-            frequency=self.habit_entries["frequency"].get().strip(),
-            success_metric=self.habit_entries["success_metric"].get().strip(),
-            linked_goal=self.habit_goal.get() or "",
+            anchor=self.habit_vars["anchor"].get().strip(),
+            frequency=self.habit_vars["frequency"].get().strip(),
+            success_metric=self.habit_vars["success_metric"].get().strip(),
+            linked_goal=self.habit_goal_var.get(),
         )
         self.state.habits.append(habit)
-        self._persist()
-        self._refresh_habit_tree()
+        self._habit_names.append(habit.name)
+        self._schedule_persist()
+        self._insert_habit_row(habit)
+        label = self._habit_action_label(habit)
+        self.action_list.insert(tk.END, label)
+        if self._last_action_labels is not None:
+            self._last_action_labels += (label,)
         self._refresh_goal_dependent_controls()
-        for entry in self.habit_entries.values():
-            entry.delete(0, tk.END)
+        for var in self.habit_vars.values():
+            var.set("")
 
     def _add_weekly_action(self) -> None:
-        action = self.action_entry.get().strip()
-        if not action:
-            messagebox.showwarning("Missing action", "Describe the move you want to make.")
+        action = self._require(self.action_var, "missing_action")
+        if action is None:
             return
-        bucket = self.action_timeframe.get()
-        motivation = self.action_motivation.get()
+        bucket = self.action_timeframe_var.get()
+        motivation = self.action_motivation_var.get()
         label = f"{action} ({motivation})" if motivation else action
-        self.state.weekly_actions.setdefault(bucket, []).append(label)
-        self._persist()
-        self._refresh_weekly_lists()
-        self.action_entry.delete(0, tk.END)
+        actions, listbox = self._bucket_targets[bucket]
+        actions.append(label)
+        self._schedule_persist()
+        listbox.append(label)
+        if bucket == "Today" and len(actions) <= 3:
+            self.today_focus.insert(tk.END, label)
+        self.action_var.set("")
 
     def _send_focus_to_today(self) -> None:
         today_items = self.state.weekly_actions.get("Today", [])
         if not today_items:
-            messagebox.showinfo("Action Menu", "Add at least one action to the Today bucket first.")
+            self._inform("today_empty")
             return
-        self.today_focus.delete(0, tk.END)
-        for item in today_items[:3]:
-            self.today_focus.insert(tk.END, item)
+        self._bulk_fill_listbox(self.today_focus, today_items[:3])
 
     def _add_timer_category(self) -> None:
-        if not hasattr(self, "new_timer_category"):
+        if not hasattr(self, "new_timer_category_var"):
             return
-        label = self.new_timer_category.get().strip()
-        if not label:
-            messagebox.showwarning("Time & Flow", "Name the category before adding it.")
+        label = self._require(self.new_timer_category_var, "missing_category")
+        if label is None:
             return
         if label in self.state.timer_categories:
-            messagebox.showinfo("Time & Flow", "That category already exists.")
+            self._inform("duplicate_category")
             return
         self.state.timer_categories.append(label)
-        self._persist()
+        self._schedule_persist()
         self._refresh_timer_category_choices()
         self.timer_category.set(label)
-        self.new_timer_category.delete(0, tk.END)
+        self.new_timer_category_var.set("")
 
     def _start_timer(self) -> None:
         if self.timer_start is not None:
-            messagebox.showinfo("Action Menu", "Timer already running. Stop it before starting a new block.")
+            self._inform("timer_running")
             return
-        activity = self.timer_activity.get().strip()
-        if not activity:
-            messagebox.showwarning("Need activity", "Describe the experiment or task before starting the timer.")
+        activity = self._require(self.timer_activity_var, "timer_missing_activity")
+        if activity is None:
             return
         category = self.timer_category.get() or "Creative"
-        self.timer_start = datetime.utcnow()
-        self.pending_flow_context = {
-            "activity": activity,
-            "category": category,
-            "flow_before": int(self.flow_before_var.get()),
-            "emotion_before": self.emotion_before_var.get(),
-        }
+        started = utc_now()
+        self.timer_start = started
+        self.pending_flow_context = self._snapshot_flow_context(activity, category)
         self.timer_status.set(f"Timer running: {activity} ({category})")
+        self._schedule(lambda: self._tick_timer_status(started), 1000)
+
+    def _snapshot_flow_context(self, activity: str, category: str) -> FlowContext:
+        # Read each Tk variable exactly once per timer start / manual log.
+        return FlowContext(
+            activity=activity,
+            category=category,
+            flow_before=round(float(self.flow_scale.get())),
+            emotion_before=self.emotion_before_var.get(),
+        )
+
+    def _tick_timer_status(self, started: datetime) -> None:
+        context = self.pending_flow_context
+        # A stop (or stop + restart) since this tick was scheduled ends the old chain.
+        if self.timer_start is not started or context is None:
+            return
+        elapsed = int((utc_now() - started).total_seconds())
+        minutes, seconds = divmod(elapsed, 60)
+        hours, minutes = divmod(minutes, 60)
+        self.timer_status.set(
+            f"Timer running: {context.activity} ({context.category}) · {hours:02d}:{minutes:02d}:{seconds:02d}"
+        )
+        self._schedule(lambda: self._tick_timer_status(started), 1000)
 
     def _stop_timer(self) -> None:
         if self.timer_start is None:
-            messagebox.showinfo("Action Menu", "Start the timer first.")
+            self._inform("timer_idle")
             return
-        context = self.pending_flow_context or {
-            "activity": self.timer_activity.get().strip() or "Deep work",
-            "category": self.timer_category.get() or "Creative",
-            "flow_before": int(self.flow_before_var.get()),
-            "emotion_before": self.emotion_before_var.get(),
-        }
+        context = self.pending_flow_context or self._snapshot_flow_context(
+            self.timer_activity_var.get().strip() or "Deep work",
+            self.timer_category.get() or "Creative",
+        )
         start = self.timer_start
-        end = datetime.utcnow()
+        end = utc_now()
         self.timer_start = None
         self.pending_flow_context = None
         self.timer_status.set("Timer idle")
         self._record_time_entry(
-            activity=context["activity"],
-            category=context["category"],
+            activity=context.activity,
+            category=context.category,
             start=start,
             end=end,
             flow_context=context,
         )
 
     def _manual_time_entry(self) -> None:
-        activity = self.timer_activity.get().strip()
-        if not activity:
-            messagebox.showwarning("Need activity", "Fill in the activity field before logging manually.")
+        activity = self._require(self.timer_activity_var, "manual_missing_activity")
+        if activity is None:
             return
         category = self.timer_category.get() or "Creative"
+        from tkinter import simpledialog
+
         duration = simpledialog.askfloat(
             "Manual log",
             "How many hours should we log?",
@@ -400,14 +713,9 @@ class ActionMenuApp(tk.Tk):
         )
         if duration is None:
             return
-        end = datetime.utcnow()
+        end = utc_now()
         start = end - timedelta(hours=duration)
-        context = {
-            "activity": activity,
-            "category": category,
-            "flow_before": int(self.flow_before_var.get()),
-            "emotion_before": self.emotion_before_var.get(),
-        }
+        context = self._snapshot_flow_context(activity, category)
         self._record_time_entry(activity=activity, category=category, start=start, end=end, flow_context=context)
 
     def _record_time_entry(
@@ -417,7 +725,7 @@ class ActionMenuApp(tk.Tk):
         category: str,
         start: datetime,
         end: datetime,
-        flow_context: Dict[str, int | str] | None,
+        flow_context: FlowContext | None,
     ) -> None:
         entry = TimeEntry.new(
             activity=activity,
@@ -427,95 +735,169 @@ class ActionMenuApp(tk.Tk):
             calendar_color=CATEGORY_COLORS.get(category, "default"),
         )
         self.state.time_entries.append(entry)
-        self._persist()
-        self._refresh_time_tree()
+        self._time_entry_by_id[entry.id] = entry
+        self._schedule_persist()
+        self._insert_time_row(entry)
+        self._add_to_category_totals(entry)
+        self._emit_effort_summary()
         self._launch_flow_capture(entry, flow_context)
 
-    def _launch_flow_capture(self, entry: TimeEntry, flow_context: Dict[str, int | str] | None) -> None:
+    def _launch_flow_capture(self, entry: TimeEntry, flow_context: FlowContext | None) -> None:
         if not flow_context:
             return
-        dialog = FlowCaptureDialog(
-            self,
+        if self.flow_dialog is None:
+            from ui.flow_dialog import FlowCaptureDialog
+
+            self.flow_dialog = FlowCaptureDialog(self, emotions=EMOTIONS)
+        result = self.flow_dialog.ask(
             activity=entry.activity,
-            flow_before=int(flow_context.get("flow_before", 3)),
-            emotion_before=str(flow_context.get("emotion_before", EMOTIONS[0])),
-            emotions=EMOTIONS,
+            flow_before=flow_context.flow_before,
+            emotion_before=flow_context.emotion_before or EMOTIONS[0],
         )
-        self.wait_window(dialog)
-        if dialog.result:
-            self._store_flow_log(entry, flow_context, dialog.result)
+        if result:
+            self._store_flow_log(entry, flow_context, result)
 
     def _store_flow_log(
         self,
         entry: TimeEntry,
-        flow_context: Dict[str, int | str],
+        flow_context: FlowContext,
         result: Dict[str, int | str],
     ) -> None:
         log = FlowLog.new(
             time_entry_id=entry.id,
-            flow_before=int(flow_context.get("flow_before", 3)),
+            flow_before=flow_context.flow_before,
             flow_after=int(result["flow_after"]),
-            emotion_before=str(flow_context.get("emotion_before", "")),
+            emotion_before=flow_context.emotion_before,
             emotion_after=str(result["emotion_after"]),
             feeling_message=str(result["message"]),
             feeling_motivation=str(result["motivation"]),
         )
         self.state.flow_logs.append(log)
-        self._persist()
-        self._refresh_flow_logs()
+        self._schedule_persist()
+        self.flow_log_view.insert(tk.END, log.id, self._flow_row(log, entry.activity))
+        self._add_to_flow_sums(log)
+        self._emit_flow_summary()
 
     def _save_journal_entry(self) -> None:
         text = self.journal_text.get("1.0", tk.END).strip()
         if not text:
-            messagebox.showwarning("Journal", "Write something before saving.")
+            self._warn("journal_empty")
             return
-        suggestions = extract_suggestions(text)
-        tags = self._infer_tags(text)
+        pending = self._suggest_future
+        if pending is not None and self._suggested_text == text:
+            # The worker is already analysing this exact buffer; wait for it rather than doing it twice.
+            suggestions = pending.result()
+        else:
+            # Usually a cache hit: the debounced editor update has already analysed this exact buffer.
+            from journal_ai import extract_suggestions_cached
+
+            suggestions = extract_suggestions_cached(text)
+        tags = _infer_tags(text)
         entry = JournalEntry.new(text=text, tags=tags, suggestions=suggestions)
-        self.state.journal_entries.append(entry)
-        self._persist()
-        self._refresh_journal_history()
+        bisect.insort(self.state.journal_entries, entry, key=_created_at)
+        self._journal_by_id[entry.id] = entry
+        self._cancel_journal_suggestions()
+        self._schedule_persist()
+        # History is newest-first and this entry was just created, so it always goes on top.
+        self.journal_view.insert(0, entry.id, self._journal_row(entry))
+        self._trim_history_page(
+            self.journal_view, self.journal_older_button, self.state.journal_entries, self._journal_page_limit
+        )
         self._display_suggestions(suggestions)
         self._set_journal_detail(entry.text)
         self.journal_text.delete("1.0", tk.END)
+        # Clearing the editor is not typing: keep the saved entry's suggestions listed.
+        self.journal_text.edit_modified(False)
         messagebox.showinfo("Journal", f"Entry saved with {len(suggestions)} suggestion(s).")
 
+    def _on_journal_modified(self) -> None:
+        # <<Modified>> fires whenever the flag flips, including when it is cleared here; only real edits
+        # (not cursor keys or selections) set it, and clearing it re-arms the event for the next edit.
+        if not self.journal_text.edit_modified():
+            return
+        self.journal_text.edit_modified(False)
+        self._queue_journal_suggestions()
+
+    def _queue_journal_suggestions(self) -> None:
+        # Re-run extraction once typing pauses instead of on every edit.
+        self._cancel_journal_suggestions()
+        self._suggest_after_id = self.after(JOURNAL_SUGGEST_DELAY_MS, self._update_journal_suggestions)
+
+    def _cancel_journal_suggestions(self) -> None:
+        if self._suggest_after_id is not None:
+            self.after_cancel(self._suggest_after_id)
+            self._suggest_after_id = None
+        if self._suggest_future is not None:
+            self._suggest_future.cancel()
+            self._suggest_future = None
+
     def _update_journal_suggestions(self) -> None:
+        self._suggest_after_id = None
         text = self.journal_text.get("1.0", tk.END).strip()
+        if text == self._suggested_text:
+            return
+        if self._suggest_future is not None:
+            self._suggest_future.cancel()
+            self._suggest_future = None
         if not text:
-            self.current_suggestions = []
-            self.journal_suggestions.delete(0, tk.END)
-            self.journal_suggestions.insert(tk.END, "Keep writing for insights…")
+            self._display_suggestions([], placeholder="Keep writing for insights…")
+            self._suggested_text = text
             return
-        suggestions = extract_suggestions(text)
-        self._display_suggestions(suggestions)
-        if not suggestions:
-            self.journal_suggestions.insert(tk.END, "No actionable phrases yet – keep riffing.")
+        self._suggested_text = text
+        # Extraction runs on the worker; the Tk thread polls for the result so Tk is never touched off-thread.
+        from journal_ai import extract_suggestions_cached
+
+        future = self._suggest_future = self._suggestion_pool().submit(extract_suggestions_cached, text)
+        self._schedule(lambda: self._collect_suggestions(future, text), SUGGEST_POLL_MS)
+
+    def _suggestion_pool(self) -> ThreadPoolExecutor:
+        # Created (and concurrent.futures imported) on first use; most sessions never open the journal.
+        if self._nlp_pool is None:
+            from concurrent.futures import ThreadPoolExecutor
+
+            self._nlp_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="action-menu-nlp")
+        return self._nlp_pool
+
+    def _collect_suggestions(self, future: Future[List[JournalSuggestion]], text: str) -> None:
+        if future is not self._suggest_future:
+            return
+        if not future.done():
+            self._schedule(lambda: self._collect_suggestions(future, text), SUGGEST_POLL_MS)
+            return
+        self._suggest_future = None
+        self._apply_suggestions(text, future.result())
+
+    def _apply_suggestions(self, text: str, suggestions: List[JournalSuggestion]) -> None:
+        self._display_suggestions(suggestions, placeholder="No actionable phrases yet – keep riffing.")
+        self._suggested_text = text
 
-    def _display_suggestions(self, suggestions: List[JournalSuggestion]) -> None:
+    def _display_suggestions(self, suggestions: List[JournalSuggestion], *, placeholder: str | None = None) -> None:
+        # The list no longer reflects the editor buffer, so the next keystroke must re-extract.
+        self._suggested_text = None
         self.current_suggestions = suggestions
-        self.journal_suggestions.delete(0, tk.END)
-        for suggestion in suggestions:
-            label = f"[{suggestion.kind}] {suggestion.text}"
-            self.journal_suggestions.insert(tk.END, label)
+        labels = tuple(f"[{suggestion.kind}] {suggestion.text}" for suggestion in suggestions)
+        if not labels and placeholder:
+            labels = (placeholder,)
+        # Typing past the last matched sentence usually yields the same list; leave the listbox alone then.
+        if labels == self._shown_suggestion_labels:
+            return
+        self._shown_suggestion_labels = labels
+        self._bulk_fill_listbox(self.journal_suggestions, labels)
 
     def _set_journal_detail(self, text: str) -> None:
+        # The panel is read-only and only written here, so the last text set is authoritative and the
+        # comparison needs no round-trip to read the widget back.
+        if text == self._journal_detail_text:
+            return
         self.journal_detail.configure(state=tk.NORMAL)
-        self.journal_detail.delete("1.0", tk.END)
-        self.journal_detail.insert(tk.END, text)
+        self.journal_detail.replace("1.0", tk.END, text)
         self.journal_detail.configure(state=tk.DISABLED)
-
-    def _infer_tags(self, text: str) -> List[str]:
-        lowered = text.lower()
-        tags = [category for category in CATEGORY_OPTIONS if category.lower() in lowered]
-        if "rest" in lowered or "recover" in lowered:
-            tags.append("Recovery")
-        return sorted(set(tags))
+        self._journal_detail_text = text
 
     def _get_selected_suggestion(self) -> JournalSuggestion | None:
         selection = self.journal_suggestions.curselection()
         if not selection:
-            messagebox.showinfo("Journal", "Select a suggestion first.")
+            self._inform("select_suggestion")
             return None
         index = selection[0]
         if index >= len(self.current_suggestions):
@@ -528,31 +910,31 @@ class ActionMenuApp(tk.Tk):
             return
         bucket = self.state.weekly_actions.setdefault("Today", [])
         bucket.append(suggestion.text)
-        self._persist()
+        self._schedule_persist()
         self._refresh_weekly_lists()
-        messagebox.showinfo("Journal", "Added suggestion to Today focus.")
+        self._inform("suggestion_to_today")
 
     def _suggestion_to_goal(self) -> None:
         suggestion = self._get_selected_suggestion()
         if not suggestion:
             return
+        self._ensure_tab_built("goals")
         field = self.goal_vars.get("title")
         if field is None:
             return
-        field.delete(0, tk.END)
-        field.insert(0, suggestion.text)
-        messagebox.showinfo("Journal", "Drafted the text into the goal title field.")
+        field.set(suggestion.text)
+        self._inform("suggestion_to_goal")
 
     def _suggestion_to_habit(self) -> None:
         suggestion = self._get_selected_suggestion()
         if not suggestion:
             return
-        field = self.habit_entries.get("name")
+        self._ensure_tab_built("habits")
+        field = self.habit_vars.get("name")
         if field is None:
             return
-        field.delete(0, tk.END)
-        field.insert(0, suggestion.text)
-        messagebox.showinfo("Journal", "Drafted the text into the habit name field.")
+        field.set(suggestion.text)
+        self._inform("suggestion_to_habit")
 
     def _suggestion_to_capture(self) -> None:
         suggestion = self._get_selected_suggestion()
@@ -560,73 +942,95 @@ class ActionMenuApp(tk.Tk):
             return
         item = QuickCaptureItem.new(text=suggestion.text)
         self.state.quick_capture.append(item)
-        self._persist()
-        self._refresh_quick_capture_tree()
-        messagebox.showinfo("Journal", "Captured suggestion into the Inbox.")
+        self._quick_by_id[item.id] = item
+        self._schedule_persist()
+        if hasattr(self, "quick_view"):
+            self.quick_view.insert(tk.END, item.id, self._quick_row(item))
+        self._inform("suggestion_to_capture")
 
     def _on_journal_select(self, _event: tk.Event) -> None:
-        selection = self.journal_history.selection()
+        # Holding an arrow key fires a select per row; only the row it settles on is shown.
+        if self._journal_select_after_id is None:
+            self._journal_select_after_id = self.after_idle(self._show_selected_journal_entry)
+
+    def _show_selected_journal_entry(self) -> None:
+        self._journal_select_after_id = None
+        selection = self.journal_view.selection()
         if not selection:
             return
-        entry_id = selection[0]
-        entry = next((item for item in self.state.journal_entries if item.id == entry_id), None)
-        if not entry:
+        entry = self._journal_by_id.get(selection[0])
+        if entry is None:
             return
+        self._cancel_journal_suggestions()
         self._set_journal_detail(entry.text)
         self._display_suggestions(entry.suggestions)
 
     def _add_quick_item(self) -> None:
-        text = self.quick_entry.get().strip()
-        if not text:
-            messagebox.showwarning("Quick capture", "Drop a thought before hitting capture.")
+        text = self._require(self.quick_entry_var, "quick_empty")
+        if text is None:
             return
         item = QuickCaptureItem.new(text=text)
         self.state.quick_capture.append(item)
-        self.quick_entry.delete(0, tk.END)
-        self._persist()
-        self._refresh_quick_capture_tree()
+        self._quick_by_id[item.id] = item
+        self.quick_entry_var.set("")
+        self._schedule_persist()
+        self.quick_view.insert(tk.END, item.id, self._quick_row(item))
 
     def _update_quick_status(self, status: str) -> None:
         if status not in QUICK_CAPTURE_STATUSES:
             return
-        selection = self.quick_tree.selection()
+        selection = self.quick_view.selection()
         if not selection:
-            messagebox.showinfo("Quick capture", "Select one or more items first.")
+            self._inform("quick_select_many")
             return
         updated = 0
         for item_id in selection:
-            item = next((entry for entry in self.state.quick_capture if entry.id == item_id), None)
+            item = self._quick_by_id.get(item_id)
             if item and item.status != status:
                 item.status = status
+                self.quick_view.update(item.id, self._quick_row(item))
                 updated += 1
         if updated:
-            self._persist()
-            self._refresh_quick_capture_tree()
+            self._schedule_persist()
         self.quick_status_msg.set(f"{updated} item(s) → {status}")
 
     def _delete_quick_item(self) -> None:
-        selection = self.quick_tree.selection()
+        selection = self.quick_view.selection()
         if not selection:
-            messagebox.showinfo("Quick capture", "Select an item to delete.")
-            return
-        before = len(self.state.quick_capture)
-        self.state.quick_capture = [item for item in self.state.quick_capture if item.id not in selection]
-        removed = before - len(self.state.quick_capture)
-        if removed:
-            self._persist()
-            self._refresh_quick_capture_tree()
+            self._inform("quick_select_delete")
+            return
+        # The id index says which selected rows still exist, so the list is only walked when needed.
+        doomed = {item_id for item_id in selection if self._quick_by_id.pop(item_id, None) is not None}
+        removed = len(doomed)
+        if doomed:
+            self._delete_quick_captures(doomed)
+            self._schedule_persist()
+            self.quick_view.remove(doomed)
         self.quick_status_msg.set(f"Removed {removed} item(s)")
 
+    def _delete_quick_captures(self, doomed: set[str]) -> None:
+        # Delete in place from the end: no new list, and recently captured items are found first.
+        items = self.state.quick_capture
+        remaining = len(doomed)
+        for index in range(len(items) - 1, -1, -1):
+            if items[index].id in doomed:
+                del items[index]
+                remaining -= 1
+                if not remaining:
+                    break
+
     def _edit_quick_item(self) -> None:
-        selection = self.quick_tree.selection()
+        selection = self.quick_view.selection()
         if not selection:
-            messagebox.showinfo("Quick capture", "Select an item to edit.")
+            self._inform("quick_select_edit")
             return
         item_id = selection[0]
-        item = next((entry for entry in self.state.quick_capture if entry.id == item_id), None)
+        item = self._quick_by_id.get(item_id)
         if not item:
-            messagebox.showwarning("Quick capture", "Unable to locate that item.")
+            self._warn("quick_missing_item")
             return
+        from tkinter import simpledialog
+
         new_text = simpledialog.askstring(
             "Edit quick capture",
             "Update the text for this entry:",
@@ -637,25 +1041,52 @@ class ActionMenuApp(tk.Tk):
             return
         new_text = new_text.strip()
         if not new_text:
-            messagebox.showwarning("Quick capture", "Text cannot be empty.")
+            self._warn("quick_blank_text")
             return
         if new_text == item.text:
             return
         item.text = new_text
-        self._persist()
-        self._refresh_quick_capture_tree()
+        self._schedule_persist()
+        self.quick_view.update(item.id, self._quick_row(item))
         self.quick_status_msg.set("Updated entry text")
 
     def _mock_calendar_connect(self) -> None:
-        messagebox.showinfo(
-            "Integrations",
-            "Pretending to connect to Google Calendar. Future builds will detect conflicts and sync colors.",
-        )
+        self._inform("calendar_mock")
+
+    def _schedule_persist(self) -> None:
+        # Bursts of edits collapse into a single snapshot once the UI has been quiet for a moment.
+        self._dirty = True
+        if self._flush_after_id is not None:
+            self.after_cancel(self._flush_after_id)
+        self._flush_after_id = self.after(PERSIST_DELAY_MS, self._flush_persist)
+
+    def _flush_persist(self) -> None:
+        if self._flush_after_id is not None:
+            self.after_cancel(self._flush_after_id)
+            self._flush_after_id = None
+        if not self._dirty:
+            return
+        self._dirty = False
+        # Encode on the Tk thread so the state is never read mid-mutation; disk I/O happens in the writer.
+        self._writer.submit(self.storage.encode(self.state))
+
+    def _flush_now(self) -> None:
+        """Write any pending edits and wait for the writer; safe to call more than once."""
+        self._flush_persist()
+        self._writer.close()
 
-    def _persist(self) -> None:
-        self.storage.save(self.state)
+    def _on_close(self) -> None:
+        self._cancel_journal_suggestions()
+        if self._nlp_pool is not None:
+            self._nlp_pool.shutdown(wait=False, cancel_futures=True)
+        self._flush_now()
+        self.destroy()
 
 
 if __name__ == "__main__":
     app = ActionMenuApp()
-    app.mainloop()
+    try:
+        app.mainloop()
+    finally:
+        # Covers exits that bypass WM_DELETE_WINDOW (Ctrl+C, an exception escaping mainloop).
+        app._flush_now()
@@ -1,43 +1,53 @@
 """Lightweight NLP helpers for journal suggestion extraction."""
 from __future__ import annotations
 
+from functools import lru_cache
 import re
-from typing import List
+from typing import List, Tuple
 
 from models import JournalSuggestion
 
+# Priority order: a sentence that matches several kinds gets the first one listed here.
 _KEYWORD_PATTERNS = {
-    "goal": re.compile(
-        r"\b(want to|goal|aspire|dream|become|vision|plan to|aim to|objective|target|would love)\b",
-        re.IGNORECASE,
-    ),
-    "habit": re.compile(
-        r"\b(habit|every day|routine|ritual|each morning|before bed|after I|whenever I)\b",
-        re.IGNORECASE,
-    ),
-    "action": re.compile(
-        r"\b(today|this week|tonight|right now|start|finish|send|draft|schedule|call|ship|email|publish)\b",
-        re.IGNORECASE,
-    ),
-    "blockage": re.compile(
-        r"\b(stuck|blocked|fear|worried|can't|overwhelmed|tired|burned out|anxious|procrastinat)\w*\b",
-        re.IGNORECASE,
-    ),
+    "goal": r"\b(?:want to|goal|aspire|dream|become|vision|plan to|aim to|objective|target|would love)\b",
+    "habit": r"\b(?:habit|every day|routine|ritual|each morning|before bed|after I|whenever I)\b",
+    "action": r"\b(?:today|this week|tonight|right now|start|finish|send|draft|schedule|call|ship|email|publish)\b",
+    "blockage": r"\b(?:stuck|blocked|fear|worried|can't|overwhelmed|tired|burned out|anxious|procrastinat)\w*\b",
 }
+# One match per sentence. Each kind sits in a lookahead tried in priority order from the start, so
+# the result equals checking the kinds one by one rather than whichever keyword appears first.
+_KIND_PATTERN = re.compile(
+    "(?:" + "|".join(f"(?=.*?(?P<{kind}>{pattern}))" for kind, pattern in _KEYWORD_PATTERNS.items()) + ")",
+    re.IGNORECASE | re.DOTALL,
+)
+
+# A sentence runs until . ! or ? followed by whitespace; punctuation inside a word, as in "v1.2",
+# stays in the sentence.
+_SENTENCE_PATTERN = re.compile(r"(?:[^.!?]|[.!?](?!\s))+")
 
 
 def extract_suggestions(entry_text: str) -> List[JournalSuggestion]:
     suggestions: List[JournalSuggestion] = []
-    sentences = [chunk.strip() for chunk in re.split(r"[.!?]\s+", entry_text) if chunk.strip()]
-    for sentence in sentences:
+    for chunk in _SENTENCE_PATTERN.finditer(entry_text):
+        sentence = chunk.group().strip()
+        if not sentence:
+            continue
         matched_kind = _match_kind(sentence)
         if matched_kind:
             suggestions.append(JournalSuggestion(text=sentence, kind=matched_kind))
     return suggestions
 
 
+def extract_suggestions_cached(entry_text: str) -> List[JournalSuggestion]:
+    """Memoized extract_suggestions for re-analysing the same buffer while typing or backspacing."""
+    return list(_extract_cached(entry_text))
+
+
+@lru_cache(maxsize=64)
+def _extract_cached(entry_text: str) -> Tuple[JournalSuggestion, ...]:
+    return tuple(extract_suggestions(entry_text))
+
+
 def _match_kind(sentence: str) -> str | None:
-    for kind, pattern in _KEYWORD_PATTERNS.items():
-        if pattern.search(sentence):
-            return kind
-    return None
+    match = _KIND_PATTERN.match(sentence)
+    return match.lastgroup if match else None
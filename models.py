@@ -1,8 +1,9 @@
 """Domain models for the Action Menu prototype."""
 from __future__ import annotations
 
-from dataclasses import dataclass, field, asdict
-from datetime import datetime
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from sys import intern
 from typing import Any, Dict, List
 import uuid
 
@@ -10,19 +11,27 @@ import uuid
 ISO_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
 
 
+def utc_now() -> datetime:
+    """Naive UTC timestamp, matching what ``_dt_from_str`` returns for stored values."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
 def _dt_to_str(value: datetime) -> str:
-    return value.strftime(ISO_FORMAT)
+    # Same text as strftime(ISO_FORMAT) for the naive UTC values stored here, via the C formatter.
+    return value.isoformat(timespec="microseconds") + "Z"
 
 
 def _dt_from_str(value: str) -> datetime:
-    return datetime.strptime(value, ISO_FORMAT)
+    # fromisoformat is implemented in C; strptime goes through the pure-Python _strptime module.
+    # The "Z" is dropped so the result stays naive, like everything else in the state.
+    return datetime.fromisoformat(value.removesuffix("Z"))
 
 
 def _uuid() -> str:
     return uuid.uuid4().hex
 
 
-@dataclass
+@dataclass(slots=True)
 class SmartGoal:
     id: str
     title: str
@@ -63,14 +72,25 @@ class SmartGoal:
         )
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            "id": self.id,
+            "title": self.title,
+            "specific": self.specific,
+            "measurable": self.measurable,
+            "achievable": self.achievable,
+            "relevant": self.relevant,
+            "time_bound": self.time_bound,
+            "horizon": self.horizon,
+            "category": self.category,
+            "calendar_color": self.calendar_color,
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "SmartGoal":
         return cls(**data)
 
 
-@dataclass
+@dataclass(slots=True)
 class HabitPlan:
     id: str
     name: str
@@ -99,14 +119,21 @@ class HabitPlan:
         )
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            "id": self.id,
+            "name": self.name,
+            "anchor": self.anchor,
+            "frequency": self.frequency,
+            "success_metric": self.success_metric,
+            "linked_goal": self.linked_goal,
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "HabitPlan":
         return cls(**data)
 
 
-@dataclass
+@dataclass(slots=True)
 class TimeEntry:
     id: str
     activity: str
@@ -114,10 +141,10 @@ class TimeEntry:
     start: datetime
     end: datetime
     calendar_color: str = "default"
+    duration_hours: float = field(init=False, default=0.0)
 
-    @property
-    def duration_hours(self) -> float:
-        return round((self.end - self.start).total_seconds() / 3600, 2)
+    def __post_init__(self) -> None:
+        self.duration_hours = round((self.end - self.start).total_seconds() / 3600, 2)
 
     @classmethod
     def new(
@@ -139,20 +166,31 @@ class TimeEntry:
         )
 
     def to_dict(self) -> Dict[str, Any]:
-        data = asdict(self)
-        data["start"] = _dt_to_str(self.start)
-        data["end"] = _dt_to_str(self.end)
-        return data
+        # duration_hours is derived from start/end on load, so it is not stored.
+        return {
+            "id": self.id,
+            "activity": self.activity,
+            "category": self.category,
+            "start": _dt_to_str(self.start),
+            "end": _dt_to_str(self.end),
+            "calendar_color": self.calendar_color,
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "TimeEntry":
-        data = dict(data)
-        data["start"] = _dt_from_str(data["start"])
-        data["end"] = _dt_from_str(data["end"])
-        return cls(**data)
+        # Positional: no copy of the record and no keyword matching per row on load. Enumerated
+        # fields are interned here and in the other record loaders so repeats share one string.
+        return cls(
+            data["id"],
+            data["activity"],
+            intern(data["category"]),
+            _dt_from_str(data["start"]),
+            _dt_from_str(data["end"]),
+            intern(data.get("calendar_color", "default")),
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class FlowLog:
     id: str
     time_entry_id: str
@@ -185,35 +223,51 @@ class FlowLog:
             emotion_after=emotion_after,
             feeling_message=feeling_message,
             feeling_motivation=feeling_motivation,
-            created_at=datetime.utcnow(),
+            created_at=utc_now(),
         )
 
     def to_dict(self) -> Dict[str, Any]:
-        data = asdict(self)
-        data["created_at"] = _dt_to_str(self.created_at)
-        return data
+        return {
+            "id": self.id,
+            "time_entry_id": self.time_entry_id,
+            "flow_before": self.flow_before,
+            "flow_after": self.flow_after,
+            "emotion_before": self.emotion_before,
+            "emotion_after": self.emotion_after,
+            "feeling_message": self.feeling_message,
+            "feeling_motivation": self.feeling_motivation,
+            "created_at": _dt_to_str(self.created_at),
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "FlowLog":
-        data = dict(data)
-        data["created_at"] = _dt_from_str(data["created_at"])
-        return cls(**data)
+        return cls(
+            data["id"],
+            data["time_entry_id"],
+            data["flow_before"],
+            data["flow_after"],
+            intern(data["emotion_before"]),
+            intern(data["emotion_after"]),
+            data["feeling_message"],
+            data["feeling_motivation"],
+            _dt_from_str(data["created_at"]),
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class JournalSuggestion:
     text: str
     kind: str  # goal | habit | action | blockage
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {"text": self.text, "kind": self.kind}
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "JournalSuggestion":
-        return cls(**data)
+        return cls(data["text"], intern(data["kind"]))
 
 
-@dataclass
+@dataclass(slots=True)
 class JournalEntry:
     id: str
     created_at: datetime
@@ -231,7 +285,7 @@ class JournalEntry:
     ) -> "JournalEntry":
         return cls(
             id=_uuid(),
-            created_at=datetime.utcnow(),
+            created_at=utc_now(),
             text=text,
             tags=tags,
             suggestions=suggestions,
@@ -243,21 +297,22 @@ class JournalEntry:
             "created_at": _dt_to_str(self.created_at),
             "text": self.text,
             "tags": self.tags,
-            "suggestions": [s.to_dict() for s in self.suggestions],
+            # Most entries have no suggestions; skip the comprehension frame for them.
+            "suggestions": [s.to_dict() for s in self.suggestions] if self.suggestions else [],
         }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "JournalEntry":
         return cls(
-            id=data["id"],
-            created_at=_dt_from_str(data["created_at"]),
-            text=data["text"],
-            tags=data.get("tags", []),
-            suggestions=[JournalSuggestion.from_dict(s) for s in data.get("suggestions", [])],
+            data["id"],
+            _dt_from_str(data["created_at"]),
+            data["text"],
+            [intern(tag) for tag in data.get("tags", ())],
+            [JournalSuggestion.from_dict(s) for s in data.get("suggestions", [])],
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class QuickCaptureItem:
     id: str
     text: str
@@ -266,7 +321,7 @@ class QuickCaptureItem:
 
     @classmethod
     def new(cls, text: str, status: str = "Inbox") -> "QuickCaptureItem":
-        return cls(id=_uuid(), text=text, status=status, created_at=datetime.utcnow())
+        return cls(id=_uuid(), text=text, status=status, created_at=utc_now())
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -278,44 +333,60 @@ class QuickCaptureItem:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "QuickCaptureItem":
-        return cls(
-            id=data["id"],
-            text=data["text"],
-            status=data["status"],
-            created_at=_dt_from_str(data["created_at"]),
-        )
+        return cls(data["id"], data["text"], intern(data["status"]), _dt_from_str(data["created_at"]))
 
 
-@dataclass
+@dataclass(slots=True)
 class Reflections:
     values: str = ""
     milestones: str = ""
     energy: str = ""
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {"values": self.values, "milestones": self.milestones, "energy": self.energy}
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Reflections":
         return cls(**data)
 
 
-@dataclass
+WEEKLY_BUCKETS = ("Today", "This Week", "This Month")
+_DEFAULT_TIMER_CATEGORIES = ("Creative", "Learning", "Working", "Body", "Recovery")
+
+
+def _default_weekly_actions() -> Dict[str, List[str]]:
+    return {bucket: [] for bucket in WEEKLY_BUCKETS}
+
+
+@dataclass(slots=True)
 class AppState:
     reflections: Reflections = field(default_factory=Reflections)
     goals: List[SmartGoal] = field(default_factory=list)
     habits: List[HabitPlan] = field(default_factory=list)
-    weekly_actions: Dict[str, List[str]] = field(
-        default_factory=lambda: {"Today": [], "This Week": [], "This Month": []}
-    )
-    timer_categories: List[str] = field(
-        default_factory=lambda: ["Creative", "Learning", "Working", "Body", "Recovery"]
-    )
+    weekly_actions: Dict[str, List[str]] = field(default_factory=_default_weekly_actions)
+    timer_categories: List[str] = field(default_factory=lambda: list(_DEFAULT_TIMER_CATEGORIES))
     time_entries: List[TimeEntry] = field(default_factory=list)
     flow_logs: List[FlowLog] = field(default_factory=list)
     journal_entries: List[JournalEntry] = field(default_factory=list)
     quick_capture: List[QuickCaptureItem] = field(default_factory=list)
 
+    def sections(self) -> Dict[str, Any]:
+        """Top-level layout of ``to_dict`` with the records still as model objects.
+
+        Lets an encoder expand one record at a time instead of materializing the whole tree first.
+        """
+        return {
+            "reflections": self.reflections,
+            "goals": self.goals,
+            "habits": self.habits,
+            "weekly_actions": self.weekly_actions,
+            "timer_categories": self.timer_categories,
+            "time_entries": self.time_entries,
+            "flow_logs": self.flow_logs,
+            "journal_entries": self.journal_entries,
+            "quick_capture": self.quick_capture,
+        }
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "reflections": self.reflections.to_dict(),
@@ -331,18 +402,17 @@ class AppState:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "AppState":
+        # Defaults are immutable or built only when the key is missing, not allocated on every load.
+        weekly_actions = data.get("weekly_actions")
+        timer_categories = data.get("timer_categories")
         return cls(
             reflections=Reflections.from_dict(data.get("reflections", {})),
-            goals=[SmartGoal.from_dict(item) for item in data.get("goals", [])],
-            habits=[HabitPlan.from_dict(item) for item in data.get("habits", [])],
-            weekly_actions=data.get(
-                "weekly_actions", {"Today": [], "This Week": [], "This Month": []}
-            ),
-            timer_categories=data.get(
-                "timer_categories", ["Creative", "Learning", "Working", "Body", "Recovery"]
-            ),
-            time_entries=[TimeEntry.from_dict(item) for item in data.get("time_entries", [])],
-            flow_logs=[FlowLog.from_dict(item) for item in data.get("flow_logs", [])],
-            journal_entries=[JournalEntry.from_dict(item) for item in data.get("journal_entries", [])],
-            quick_capture=[QuickCaptureItem.from_dict(item) for item in data.get("quick_capture", [])],
+            goals=[SmartGoal.from_dict(item) for item in data.get("goals", ())],
+            habits=[HabitPlan.from_dict(item) for item in data.get("habits", ())],
+            weekly_actions=_default_weekly_actions() if weekly_actions is None else weekly_actions,
+            timer_categories=list(_DEFAULT_TIMER_CATEGORIES) if timer_categories is None else timer_categories,
+            time_entries=[TimeEntry.from_dict(item) for item in data.get("time_entries", ())],
+            flow_logs=[FlowLog.from_dict(item) for item in data.get("flow_logs", ())],
+            journal_entries=[JournalEntry.from_dict(item) for item in data.get("journal_entries", ())],
+            quick_capture=[QuickCaptureItem.from_dict(item) for item in data.get("quick_capture", ())],
         )
\ No newline at end of file
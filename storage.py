@@ -2,30 +2,106 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional
 import json
+import os
+import queue
+import threading
+import traceback
 
 from models import AppState
 
 
 class StorageManager:
-    def __init__(self, file_path: Path) -> None:
+    def __init__(self, file_path: Path, *, pretty: bool = False) -> None:
         self.file_path = file_path
+        # Compact output lets json use its C encoder; indent forces the pure-Python one (~3x slower).
+        self._dump_options: Dict[str, Any] = {"indent": 2} if pretty else {"separators": (",", ":")}
         self.file_path.parent.mkdir(parents=True, exist_ok=True)
 
     def load(self) -> AppState:
         if not self.file_path.exists():
             return AppState()
         try:
-            with self.file_path.open("r", encoding="utf-8") as fh:
-                raw = json.load(fh)
+            # One read of the raw bytes; json.loads detects UTF-8 itself, so no text-mode wrapper is needed.
+            raw = json.loads(self.file_path.read_bytes())
         except json.JSONDecodeError:
             return AppState()
         return AppState.from_dict(raw)
 
     def save(self, state: AppState) -> None:
-        with self.file_path.open("w", encoding="utf-8") as fh:
-            json.dump(state.to_dict(), fh, indent=2, ensure_ascii=False)
+        self.write_bytes(self.encode(state))
+
+    def encode(self, state: AppState) -> bytes:
+        # Records are expanded by the encoder as it reaches them, so only one record's dict is alive
+        # at a time instead of a full copy of the state as nested dicts.
+        return json.dumps(
+            state.sections(), ensure_ascii=False, default=_record_to_dict, **self._dump_options
+        ).encode("utf-8")
+
+    def write_bytes(self, payload: bytes) -> None:
+        # Write next to the target and swap it in, so a crash mid-write never truncates the state file.
+        tmp_path = self.file_path.with_name(self.file_path.name + ".tmp")
+        with tmp_path.open("wb") as fh:
+            fh.write(payload)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp_path, self.file_path)
+
+
+class PersistenceWriter:
+    """Writes encoded state snapshots on a background thread.
+
+    Callers encode on their own thread (so the state is never read concurrently) and
+    hand over bytes; when several snapshots queue up only the newest one is written, and a
+    snapshot identical to the last one written is skipped.
+    """
+
+    def __init__(self, storage: StorageManager) -> None:
+        self._storage = storage
+        self._queue: "queue.Queue[Optional[bytes]]" = queue.Queue()
+        self._last_written: Optional[bytes] = None
+        self._thread = threading.Thread(target=self._run, name="action-menu-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, payload: bytes) -> None:
+        self._queue.put(payload)
+
+    def close(self) -> None:
+        """Write whatever is still queued, then stop the thread. Later calls are no-ops."""
+        if not self._thread.is_alive():
+            return
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            payload = self._queue.get()
+            closing = payload is None
+            while True:
+                try:
+                    queued = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if queued is None:
+                    closing = True
+                else:
+                    payload = queued
+            if payload is not None and payload != self._last_written:
+                try:
+                    self._storage.write_bytes(payload)
+                    self._last_written = payload
+                except OSError:
+                    traceback.print_exc()
+            if closing:
+                return
+
+
+def _record_to_dict(value: object) -> Dict[str, Any]:
+    to_dict = getattr(value, "to_dict", None)
+    if to_dict is None:
+        raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+    return to_dict()
 
 
 def get_default_store_path() -> Path:
@@ -0,0 +1,17 @@
+import unittest
+
+from action_menu import _infer_tags
+
+
+class TagInferenceTests(unittest.TestCase):
+    def test_tags_follow_category_order_and_ignore_case(self) -> None:
+        self.assertEqual(_infer_tags("RECOVERY walk, then a Startup pitch"), ["Startup", "Recovery"])
+
+    def test_case_folded_spellings_map_to_their_tag(self) -> None:
+        # "ſ" (long s) matches "s" case-insensitively but does not lower() to it.
+        self.assertEqual(_infer_tags("I need reſt today"), ["Recovery"])
+        self.assertEqual(_infer_tags("ſtartup pitch, then reſt"), ["Startup", "Recovery"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,6 @@
 import unittest
 
-from journal_ai import extract_suggestions
+from journal_ai import extract_suggestions, extract_suggestions_cached
 
 
 class JournalAISuggestionsTests(unittest.TestCase):
@@ -32,6 +32,19 @@ class JournalAISuggestionsTests(unittest.TestCase):
         kinds = [item.kind for item in suggestions]
         self.assertEqual(kinds, ["goal", "habit", "action", "blockage"])
 
+    def test_kind_priority_wins_over_keyword_position(self) -> None:
+        suggestions = extract_suggestions("Today I feel stuck but I want to become a better lead.")
+        self.assertEqual([item.kind for item in suggestions], ["goal"])
+
+    def test_cached_extraction_matches_and_returns_fresh_lists(self) -> None:
+        text = "Today I will draft the launch email."
+        first = extract_suggestions_cached(text)
+        second = extract_suggestions_cached(text)
+
+        self.assertEqual(first, extract_suggestions(text))
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+
 
 if __name__ == "__main__":
     unittest.main()
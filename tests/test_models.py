@@ -0,0 +1,47 @@
+import unittest
+from datetime import datetime, timedelta
+
+from models import JournalEntry, TimeEntry, utc_now
+
+
+class TimeEntryTests(unittest.TestCase):
+    def test_duration_hours_is_computed_at_construction(self) -> None:
+        start = datetime(2024, 3, 1, 9, 0)
+        entry = TimeEntry.new("Deep work", category="Creative", start=start, end=start + timedelta(minutes=90))
+
+        self.assertEqual(entry.duration_hours, 1.5)
+
+    def test_roundtrip_does_not_persist_duration(self) -> None:
+        start = datetime(2024, 3, 1, 9, 0)
+        entry = TimeEntry.new("Deep work", category="Creative", start=start, end=start + timedelta(hours=2))
+
+        data = entry.to_dict()
+        reloaded = TimeEntry.from_dict(data)
+
+        self.assertNotIn("duration_hours", data)
+        self.assertEqual(reloaded.duration_hours, 2.0)
+        self.assertEqual(reloaded.start, entry.start)
+
+
+class TimestampTests(unittest.TestCase):
+    def test_new_entries_get_naive_utc_timestamps_that_roundtrip(self) -> None:
+        before = utc_now()
+        entry = JournalEntry.new("Shipped the API.", tags=[], suggestions=[])
+
+        self.assertIsNone(entry.created_at.tzinfo)
+        self.assertLessEqual(before, entry.created_at)
+        self.assertEqual(JournalEntry.from_dict(entry.to_dict()).created_at, entry.created_at)
+
+    def test_stored_timestamp_format_is_stable(self) -> None:
+        start = datetime(2024, 3, 1, 9, 5, 7, 120)
+        entry = TimeEntry.new("Deep work", category="Creative", start=start, end=start + timedelta(hours=1))
+
+        data = entry.to_dict()
+
+        self.assertEqual(data["start"], "2024-03-01T09:05:07.000120Z")
+        self.assertEqual(TimeEntry.from_dict(data).start, start)
+        self.assertIsNone(TimeEntry.from_dict(data).start.tzinfo)
+
+
+if __name__ == "__main__":
+    unittest.main()
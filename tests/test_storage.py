@@ -1,9 +1,11 @@
+import json
 import unittest
 from pathlib import Path
 from tempfile import TemporaryDirectory
+import threading
 
-from models import AppState, SmartGoal
-from storage import StorageManager
+from models import AppState, JournalEntry, SmartGoal
+from storage import PersistenceWriter, StorageManager
 
 
 class StorageManagerTests(unittest.TestCase):
@@ -37,6 +39,73 @@ class StorageManagerTests(unittest.TestCase):
             self.assertEqual(len(loaded.goals), 0)
             self.assertGreaterEqual(len(loaded.timer_categories), 1)
 
+    def test_save_replaces_file_without_leaving_temp_file(self) -> None:
+        with TemporaryDirectory() as tmp:
+            path = Path(tmp) / "state.json"
+            path.write_text("{}", encoding="utf-8")
+            manager = StorageManager(path)
+
+            state = AppState()
+            state.goals.append(SmartGoal.new(title="Atomic save"))
+            manager.save(state)
+
+            self.assertEqual([p.name for p in Path(tmp).iterdir()], ["state.json"])
+            self.assertEqual(StorageManager(path).load().goals[0].title, "Atomic save")
+
+    def test_encode_matches_full_dict_dump(self) -> None:
+        state = AppState()
+        state.goals.append(SmartGoal.new(title="Stream records"))
+        state.journal_entries.append(JournalEntry.new("Ship it today.", tags=["Startup"], suggestions=[]))
+
+        compact = json.dumps(state.to_dict(), separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        pretty = json.dumps(state.to_dict(), indent=2, ensure_ascii=False).encode("utf-8")
+
+        with TemporaryDirectory() as tmp:
+            path = Path(tmp) / "state.json"
+            self.assertEqual(StorageManager(path).encode(state), compact)
+            self.assertEqual(StorageManager(path, pretty=True).encode(state), pretty)
+
+    def test_background_writer_keeps_latest_snapshot(self) -> None:
+        with TemporaryDirectory() as tmp:
+            path = Path(tmp) / "state.json"
+            manager = StorageManager(path)
+            writer = PersistenceWriter(manager)
+
+            state = AppState()
+            state.goals.append(SmartGoal.new(title="First draft"))
+            writer.submit(manager.encode(state))
+            state.goals.append(SmartGoal.new(title="Second draft"))
+            writer.submit(manager.encode(state))
+            writer.close()
+            writer.close()
+
+            reloaded = StorageManager(path).load()
+
+            self.assertEqual([goal.title for goal in reloaded.goals], ["First draft", "Second draft"])
+
+    def test_background_writer_skips_unchanged_snapshot(self) -> None:
+        with TemporaryDirectory() as tmp:
+            path = Path(tmp) / "state.json"
+            manager = StorageManager(path)
+            writes: list[bytes] = []
+            written = threading.Event()
+            original_write = manager.write_bytes
+
+            def record(payload: bytes) -> None:
+                original_write(payload)
+                writes.append(payload)
+                written.set()
+
+            manager.write_bytes = record  # type: ignore[method-assign]
+            writer = PersistenceWriter(manager)
+            payload = manager.encode(AppState())
+            writer.submit(payload)
+            self.assertTrue(written.wait(timeout=5))
+            writer.submit(payload)
+            writer.close()
+
+            self.assertEqual(writes, [payload])
+
 
 if __name__ == "__main__":
     unittest.main()
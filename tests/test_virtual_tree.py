@@ -0,0 +1,68 @@
+import unittest
+import tkinter as tk
+from tkinter import ttk
+
+from ui.virtual_tree import VirtualTreeview
+
+
+class VirtualTreeviewTests(unittest.TestCase):
+    def setUp(self) -> None:
+        try:
+            self.root = tk.Tk()
+        except tk.TclError:
+            self.skipTest("Tk needs a display")
+        self.addCleanup(self.root.destroy)
+        self.root.withdraw()
+        self.tree = ttk.Treeview(self.root, columns=("label",), show="headings", height=3)
+        self.view = VirtualTreeview(self.tree, ttk.Scrollbar(self.root))
+
+    def _set_rows(self, count: int) -> None:
+        self.view.set_rows((f"r{index}", (f"Row {index}",)) for index in range(count))
+
+    def test_set_rows_reorder_rebuilds_window(self) -> None:
+        self._set_rows(5)
+        self.view.set_rows((f"r{index}", (f"Row {index}",)) for index in reversed(range(5)))
+
+        self.assertEqual(self.tree.get_children(), ("r4", "r3", "r2"))
+        self.assertEqual(self.tree.item("r4", "values"), ("Row 4",))
+
+    def test_scroll_is_clamped_to_the_rows(self) -> None:
+        self._set_rows(10)
+
+        self.assertTrue(self.view._scroll_to(100))
+        self.assertEqual(self.tree.get_children(), ("r7", "r8", "r9"))
+        self.assertTrue(self.view._scroll_to(-5))
+        self.assertEqual(self.tree.get_children(), ("r0", "r1", "r2"))
+        self.assertFalse(self.view._scroll_to(-1))
+
+    def test_selection_survives_scrolling(self) -> None:
+        self._set_rows(10)
+        self.tree.selection_set("r1")
+        self.root.update()
+
+        self.view._scroll_to(5)
+        self.root.update()
+        self.assertEqual(self.tree.selection(), ())
+        self.assertEqual(self.view.selection(), ("r1",))
+
+        self.view._scroll_to(0)
+        self.root.update()
+        self.assertEqual(self.tree.selection(), ("r1",))
+
+    def test_remove_drops_selected_offscreen_rows(self) -> None:
+        self._set_rows(10)
+        self.tree.selection_set("r0")
+        self.root.update()
+        self.view._scroll_to(5)
+        self.root.update()
+
+        self.view.remove(["r0"])
+
+        self.assertEqual(len(self.view), 9)
+        self.assertEqual(self.view.selection(), ())
+        self.view._scroll_to(0)
+        self.assertEqual(self.tree.get_children(), ("r1", "r2", "r3"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,44 +7,40 @@ from tkinter import ttk
 
 
 class FlowCaptureDialog(tk.Toplevel):
-    """Collects post-session flow + emotion reflections."""
-
-    def __init__(
-        self,
-        parent: tk.Widget,
-        *,
-        activity: str,
-        flow_before: int,
-        emotion_before: str,
-        emotions: Iterable[str],
-    ) -> None:
+    """Collects post-session flow + emotion reflections.
+
+    Built once and kept withdrawn between sessions; ``ask`` resets the fields and blocks until
+    the user saves or skips.
+    """
+
+    def __init__(self, parent: tk.Widget, *, emotions: Iterable[str]) -> None:
         super().__init__(parent)
+        self.withdraw()
         self.result: dict[str, int | str] | None = None
         self._emotions: List[str] = list(emotions)
+        self._done = tk.BooleanVar(self, value=False)
 
         self.title("Flow + emotion checkout")
         self.resizable(False, False)
         self.transient(parent)
-        self.grab_set()
         self.protocol("WM_DELETE_WINDOW", self._skip)
+        # Closing the main window destroys this dialog too; that must end a pending ``ask``.
+        self.bind("<Destroy>", self._on_destroy, add="+")
 
         container = ttk.Frame(self, padding=16)
         container.pack(fill=tk.BOTH, expand=True)
 
-        ttk.Label(container, text=f"How did '{activity}' feel?").pack(anchor=tk.W)
-        ttk.Label(
-            container,
-            text=f"Flow before: {flow_before}/5 · Emotion before: {emotion_before}",
-        ).pack(anchor=tk.W, pady=(0, 8))
+        self._heading_var = tk.StringVar(self)
+        self._before_var = tk.StringVar(self)
+        ttk.Label(container, textvariable=self._heading_var).pack(anchor=tk.W)
+        ttk.Label(container, textvariable=self._before_var).pack(anchor=tk.W, pady=(0, 8))
 
         ttk.Label(container, text="Flow after (1-5)").pack(anchor=tk.W)
         self.flow_scale = tk.Scale(container, from_=1, to=5, orient=tk.HORIZONTAL, length=220)
-        self.flow_scale.set(flow_before)
         self.flow_scale.pack(fill=tk.X)
 
         ttk.Label(container, text="Emotion after session").pack(anchor=tk.W, pady=(10, 0))
-        default_emotion = emotion_before if emotion_before in self._emotions else (self._emotions[0] if self._emotions else "")
-        self.emotion_var = tk.StringVar(value=default_emotion)
+        self.emotion_var = tk.StringVar(self)
         ttk.Combobox(container, values=self._emotions, textvariable=self.emotion_var, state="readonly").pack(fill=tk.X)
 
         ttk.Label(container, text="What is this feeling communicating?").pack(anchor=tk.W, pady=(10, 0))
@@ -60,6 +56,25 @@ class FlowCaptureDialog(tk.Toplevel):
         ttk.Button(actions, text="Save log", command=self._save).pack(side=tk.RIGHT)
         ttk.Button(actions, text="Skip", command=self._skip).pack(side=tk.RIGHT, padx=(0, 8))
 
+    def ask(self, *, activity: str, flow_before: int, emotion_before: str) -> dict[str, int | str] | None:
+        self.result = None
+        self._heading_var.set(f"How did '{activity}' feel?")
+        self._before_var.set(f"Flow before: {flow_before}/5 · Emotion before: {emotion_before}")
+        self.flow_scale.set(flow_before)
+        default_emotion = emotion_before if emotion_before in self._emotions else (self._emotions[0] if self._emotions else "")
+        self.emotion_var.set(default_emotion)
+        self.message_text.delete("1.0", tk.END)
+        self.motivation_text.delete("1.0", tk.END)
+
+        self._done.set(False)
+        self.deiconify()
+        self.grab_set()
+        self.wait_variable(self._done)
+        if self.winfo_exists():
+            self.grab_release()
+            self.withdraw()
+        return self.result
+
     def _save(self) -> None:
         self.result = {
             "flow_after": int(self.flow_scale.get()),
@@ -67,8 +82,13 @@ class FlowCaptureDialog(tk.Toplevel):
             "message": self.message_text.get("1.0", tk.END).strip(),
             "motivation": self.motivation_text.get("1.0", tk.END).strip(),
         }
-        self.destroy()
+        self._done.set(True)
 
     def _skip(self) -> None:
         self.result = None
-        self.destroy()
+        self._done.set(True)
+
+    def _on_destroy(self, event: tk.Event) -> None:
+        # <Destroy> is also delivered here for every child widget; only the dialog itself counts.
+        if str(event.widget) == str(self):
+            self._skip()
@@ -1,10 +1,11 @@
 """Notebook tab builders for Action Menu."""
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Dict
+from typing import TYPE_CHECKING, Callable, Dict, List, Tuple
 import tkinter as tk
 from tkinter import ttk
 
+from models import WEEKLY_BUCKETS
 from ui.constants import (
     ACTION_SAMPLE,
     CATEGORY_OPTIONS,
@@ -14,10 +15,84 @@ from ui.constants import (
     QUICK_ENTRY_SAMPLE,
     TIMER_ACTIVITY_SAMPLE,
 )
+from ui.virtual_list import VirtualListbox
+from ui.virtual_tree import VirtualTreeview
 
 if TYPE_CHECKING:  # pragma: no cover
     from action_menu import ActionMenuApp
 
+_VISION_PROMPT_BLOCK = "\n".join(
+    f"• {prompt}"
+    for prompt in (
+        "Why do these ambitions matter deeply?",
+        "What would a wildly successful week look like?",
+        "What experiments prove I'm living authentically?",
+    )
+)
+_INTEGRATIONS_INFO_BLOCK = "\n".join(
+    f"• {line}"
+    for line in (
+        "Export weekly plan to Google Calendar",
+        "Sync time blocks with wearable or health data",
+        "Push habit reminders via email or mobile notifications",
+    )
+)
+
+# (label, key) per form row; keys match the model fields and the *_FIELD_SAMPLES tables.
+_GOAL_FIELDS: Tuple[Tuple[str, str], ...] = (
+    ("Title", "title"),
+    ("Specific", "specific"),
+    ("Measurable", "measurable"),
+    ("Achievable", "achievable"),
+    ("Relevant", "relevant"),
+    ("Time-bound", "time_bound"),
+)
+_HABIT_FIELDS: Tuple[Tuple[str, str], ...] = (
+    ("Habit name", "name"),
+    ("Anchor / trigger", "anchor"),
+    ("Frequency", "frequency"),
+    ("Success metric", "success_metric"),
+)
+_GOAL_HORIZONS = ("Today", "This Week", "This Month", "Long Term")
+
+# (column id, heading, anchor, width) per Treeview column.
+ColumnSpec = Tuple[str, str, str, int]
+_GOAL_COLUMNS: Tuple[ColumnSpec, ...] = (
+    ("title", "Goal", tk.W, 320),
+    ("category", "Category", tk.CENTER, 120),
+    ("horizon", "Horizon", tk.CENTER, 120),
+    ("measure", "Key Metric", tk.W, 120),
+)
+_HABIT_COLUMNS: Tuple[ColumnSpec, ...] = (
+    ("name", "Habit", tk.W, 150),
+    ("frequency", "Frequency", tk.W, 150),
+    ("anchor", "Anchor", tk.W, 150),
+    ("goal", "Goal", tk.W, 150),
+)
+_TIME_COLUMNS: Tuple[ColumnSpec, ...] = (
+    ("activity", "Activity", tk.W, 260),
+    ("category", "Category", tk.CENTER, 120),
+    ("start", "Start", tk.W, 120),
+    ("duration", "Hours", tk.CENTER, 120),
+    ("color", "Calendar tag", tk.CENTER, 140),
+)
+_FLOW_LOG_COLUMNS: Tuple[ColumnSpec, ...] = (
+    ("activity", "Block", tk.W, 240),
+    ("before", "Flow before", tk.CENTER, 120),
+    ("after", "Flow after", tk.CENTER, 120),
+    ("emotion", "Emotion after", tk.CENTER, 120),
+    ("created", "Logged", tk.CENTER, 120),
+)
+_JOURNAL_COLUMNS: Tuple[ColumnSpec, ...] = (
+    ("timestamp", "Captured", tk.CENTER, 140),
+    ("excerpt", "Excerpt", tk.W, 240),
+)
+_QUICK_CAPTURE_COLUMNS: Tuple[ColumnSpec, ...] = (
+    ("text", "Item", tk.W, 360),
+    ("status", "Status", tk.CENTER, 100),
+    ("created", "Captured", tk.CENTER, 140),
+)
+
 
 def _add_labeled_text(parent: ttk.Frame, label: str, column: int, *, height: int = 8) -> tk.Text:
     frame = ttk.Labelframe(parent, text=label, style="Card.TLabelframe")
@@ -28,19 +103,103 @@ def _add_labeled_text(parent: ttk.Frame, label: str, column: int, *, height: int
     return widget
 
 
-def build_vision_tab(app: "ActionMenuApp", parent: ttk.Notebook) -> ttk.Frame:
+# (argument list, body) of the Tcl procs the builders call. Each is defined on first use, so Tcl
+# compiles the body once and every later tab reuses the bytecode.
+_TCL_PROCS: Dict[str, Tuple[str, str]] = {
+    # Applies a flattened ColumnSpec table, so a whole tree is configured in one call.
+    "am_configure_tree": (
+        "tree specs",
+        "foreach {col text anchor width} $specs "
+        "{$tree heading $col -text $text; $tree column $col -anchor $anchor -width $width}",
+    ),
+    # Grids (label, entry) path pairs row by row, so a whole form is laid out in one call.
+    "am_grid_form_rows": (
+        "pairs",
+        "set row 0; foreach {label entry} $pairs "
+        "{grid $label -row $row -column 0 -sticky w -pady 3; "
+        "grid $entry -row $row -column 1 -sticky ew -padx 6 -pady 3; incr row}",
+    ),
+}
+
+
+def _call_proc(widget: tk.Misc, name: str, *args: object) -> None:
+    try:
+        widget.tk.call(name, *args)
+    except tk.TclError:
+        if widget.tk.call("info", "commands", name):
+            raise
+        widget.tk.call("proc", name, *_TCL_PROCS[name])
+        widget.tk.call(name, *args)
+
+
+def _configure_columns(tree: ttk.Treeview, specs: Tuple[ColumnSpec, ...]) -> None:
+    # The spec travels as a proper Tcl list argument, so headings need no script quoting.
+    flat = tuple(value for spec in specs for value in spec)
+    _call_proc(tree, "am_configure_tree", tree._w, flat)
+
+
+def _populate_form(
+    app: "ActionMenuApp",
+    form: ttk.Labelframe,
+    fields: Tuple[Tuple[str, str], ...],
+    samples: Dict[str, str],
+    on_submit: Callable[[], None],
+) -> Dict[str, tk.StringVar]:
+    variables: Dict[str, tk.StringVar] = {}
+    pairs: List[str] = []
+    for label, key in fields:
+        var = tk.StringVar(app, value=samples.get(key, ""))
+        entry = ttk.Entry(form, textvariable=var)
+        app._bind_submit(entry, on_submit)
+        variables[key] = var
+        pairs += (ttk.Label(form, text=label)._w, entry._w)
+    _call_proc(form, "am_grid_form_rows", tuple(pairs))
+    form.columnconfigure(1, weight=1)
+    return variables
+
+
+def _select_sample_on_focus(entry: ttk.Entry, sample: str) -> None:
+    # The prefilled sample is selected only when the entry gains focus (after the click has placed
+    # the cursor), so the first keystroke replaces it; building the tab touches no selection at all.
+    def _on_focus(_event: tk.Event) -> None:
+        entry.after_idle(_select_if_untouched)
+
+    def _select_if_untouched() -> None:
+        if entry.get() == sample:
+            entry.select_range(0, tk.END)
+            entry.icursor(tk.END)
+
+    entry.bind("<FocusIn>", _on_focus, add="+")
+
+
+def _snap_scale(scale: ttk.Scale) -> None:
+    scale.set(round(float(scale.get())))
+
+
+def _virtual_tree(
+    parent: tk.Widget, specs: Tuple[ColumnSpec, ...], *, height: int
+) -> Tuple[ttk.Frame, ttk.Treeview, VirtualTreeview]:
+    holder = ttk.Frame(parent)
+    tree = ttk.Treeview(holder, columns=tuple(spec[0] for spec in specs), show="headings", height=height)
+    _configure_columns(tree, specs)
+    scrollbar = ttk.Scrollbar(holder, orient=tk.VERTICAL)
+    scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+    tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+    return holder, tree, VirtualTreeview(tree, scrollbar)
+
+
+def build_vision_tab(app: "ActionMenuApp", parent: ttk.Frame) -> ttk.Frame:
     tab = ttk.Frame(parent, padding=20)
 
-    prompts = (
-        "Why do these ambitions matter deeply?",
-        "What would a wildly successful week look like?",
-        "What experiments prove I'm living authentically?",
-    )
     ttk.Label(tab, text="Authentic Life Prompts", font=("Segoe UI", 14, "bold")).pack(anchor=tk.W)
-    prompt_box = tk.Text(tab, height=5, wrap=tk.WORD)
-    prompt_box.insert(tk.END, "\n".join(f"• {p}" for p in prompts))
-    prompt_box.configure(state=tk.DISABLED, bg="#f8f8f8", relief=tk.FLAT)
-    prompt_box.pack(fill=tk.X, pady=(6, 12))
+    ttk.Label(
+        tab,
+        text=_VISION_PROMPT_BLOCK,
+        justify=tk.LEFT,
+        wraplength=900,
+        background="#f8f8f8",
+        padding=6,
+    ).pack(fill=tk.X, pady=(6, 12))
 
     input_frame = ttk.Frame(tab)
     input_frame.pack(fill=tk.BOTH, expand=True)
@@ -58,7 +217,7 @@ def build_vision_tab(app: "ActionMenuApp", parent: ttk.Notebook) -> ttk.Frame:
     return tab
 
 
-def build_goals_tab(app: "ActionMenuApp", parent: ttk.Notebook) -> ttk.Frame:
+def build_goals_tab(app: "ActionMenuApp", parent: ttk.Frame) -> ttk.Frame:
     tab = ttk.Frame(parent, padding=20)
 
     ttk.Label(
@@ -70,28 +229,11 @@ def build_goals_tab(app: "ActionMenuApp", parent: ttk.Notebook) -> ttk.Frame:
     form = ttk.Labelframe(tab, text="Define a SMART goal", style="Card.TLabelframe")
     form.pack(fill=tk.X)
 
-    app.goal_vars = {}
-    fields = [
-        ("Title", "title"),
-        ("Specific", "specific"),
-        ("Measurable", "measurable"),
-        ("Achievable", "achievable"),
-        ("Relevant", "relevant"),
-        ("Time-bound", "time_bound"),
-    ]
-    for idx, (label, key) in enumerate(fields):
-        ttk.Label(form, text=label).grid(row=idx, column=0, sticky=tk.W, pady=3)
-        entry = ttk.Entry(form)
-        entry.grid(row=idx, column=1, sticky=tk.EW, padx=6, pady=3)
-        app.goal_vars[key] = entry
-        sample = GOAL_FIELD_SAMPLES.get(key)
-        if sample:
-            entry.insert(0, sample)
-        app._bind_submit(entry, app._add_goal)
-    form.columnconfigure(1, weight=1)
+    fields = _GOAL_FIELDS
+    app.goal_vars = _populate_form(app, form, fields, GOAL_FIELD_SAMPLES, app._add_goal)
 
     ttk.Label(form, text="Horizon").grid(row=len(fields), column=0, sticky=tk.W, pady=3)
-    app.goal_horizon = ttk.Combobox(form, values=["Today", "This Week", "This Month", "Long Term"], state="readonly")
+    app.goal_horizon = ttk.Combobox(form, values=_GOAL_HORIZONS, state="readonly")
     app.goal_horizon.current(3)
     app.goal_horizon.grid(row=len(fields), column=1, sticky=tk.EW, padx=6, pady=3)
 
@@ -102,21 +244,8 @@ def build_goals_tab(app: "ActionMenuApp", parent: ttk.Notebook) -> ttk.Frame:
 
     ttk.Button(form, text="Add goal", command=app._add_goal).grid(row=len(fields) + 2, column=1, sticky=tk.E, pady=8)
 
-    app.goal_tree = ttk.Treeview(
-        tab,
-        columns=("title", "category", "horizon", "measure"),
-        show="headings",
-        height=10,
-    )
-    for col, label in zip(
-        ("title", "category", "horizon", "measure"),
-        ("Goal", "Category", "Horizon", "Key Metric"),
-    ):
-        app.goal_tree.heading(col, text=label)
-        anchor = tk.CENTER if col in {"category", "horizon"} else tk.W
-        width = 120 if col != "title" else 320
-        app.goal_tree.column(col, anchor=anchor, width=width)
-    app.goal_tree.pack(fill=tk.BOTH, expand=True, pady=12)
+    holder, app.goal_tree, app.goal_view = _virtual_tree(tab, _GOAL_COLUMNS, height=10)
+    holder.pack(fill=tk.BOTH, expand=True, pady=12)
     app._attach_tooltip(
         app.goal_tree,
         "Store each goal with category + horizon. Use the buttons above to add new entries and double-click to review details.",
@@ -125,7 +254,7 @@ def build_goals_tab(app: "ActionMenuApp", parent: ttk.Notebook) -> ttk.Frame:
     return tab
 
 
-def build_habits_tab(app: "ActionMenuApp", parent: ttk.Notebook) -> ttk.Frame:
+def build_habits_tab(app: "ActionMenuApp", parent: ttk.Frame) -> ttk.Frame:
     tab = ttk.Frame(parent, padding=20)
 
     ttk.Label(
@@ -137,40 +266,18 @@ def build_habits_tab(app: "ActionMenuApp", parent: ttk.Notebook) -> ttk.Frame:
     form = ttk.Labelframe(tab, text="Habit design (cue → action → celebrate)", style="Card.TLabelframe")
     form.pack(fill=tk.X)
 
-    app.habit_entries = {}
-    fields = [
-        ("Habit name", "name"),
-        ("Anchor / trigger", "anchor"),
-        ("Frequency", "frequency"),
-        ("Success metric", "success_metric"),
-    ]
-    for idx, (label, key) in enumerate(fields):
-        ttk.Label(form, text=label).grid(row=idx, column=0, sticky=tk.W, pady=3)
-        entry = ttk.Entry(form)
-        entry.grid(row=idx, column=1, sticky=tk.EW, padx=6, pady=3)
-        app.habit_entries[key] = entry
-        sample = HABIT_FIELD_SAMPLES.get(key)
-        if sample:
-            entry.insert(0, sample)
-        app._bind_submit(entry, app._add_habit)
-    form.columnconfigure(1, weight=1)
+    fields = _HABIT_FIELDS
+    app.habit_vars = _populate_form(app, form, fields, HABIT_FIELD_SAMPLES, app._add_habit)
 
     ttk.Label(form, text="Linked goal").grid(row=len(fields), column=0, sticky=tk.W, pady=3)
-    app.habit_goal = ttk.Combobox(form, values=[], state="readonly")
+    app.habit_goal_var = tk.StringVar(app)
+    app.habit_goal = ttk.Combobox(form, values=[], textvariable=app.habit_goal_var, state="readonly")
     app.habit_goal.grid(row=len(fields), column=1, sticky=tk.EW, padx=6, pady=3)
 
     ttk.Button(form, text="Add habit", command=app._add_habit).grid(row=len(fields) + 1, column=1, sticky=tk.E, pady=8)
 
-    app.habit_tree = ttk.Treeview(
-        tab,
-        columns=("name", "frequency", "anchor", "goal"),
-        show="headings",
-        height=9,
-    )
-    for col, label in zip(("name", "frequency", "anchor", "goal"), ("Habit", "Frequency", "Anchor", "Goal")):
-        app.habit_tree.heading(col, text=label)
-        app.habit_tree.column(col, anchor=tk.W, width=150)
-    app.habit_tree.pack(fill=tk.BOTH, expand=True, pady=12)
+    holder, app.habit_tree, app.habit_view = _virtual_tree(tab, _HABIT_COLUMNS, height=9)
+    holder.pack(fill=tk.BOTH, expand=True, pady=12)
     app._attach_tooltip(
         app.habit_tree,
         "Habits pull from the cue/anchor you define above. Link them to goals for better context.",
@@ -187,7 +294,7 @@ def build_habits_tab(app: "ActionMenuApp", parent: ttk.Notebook) -> ttk.Frame:
     return tab
 
 
-def build_weekly_tab(app: "ActionMenuApp", parent: ttk.Notebook) -> ttk.Frame:
+def build_weekly_tab(app: "ActionMenuApp", parent: ttk.Frame) -> ttk.Frame:
     tab = ttk.Frame(parent, padding=20)
 
     ttk.Label(
@@ -200,20 +307,27 @@ def build_weekly_tab(app: "ActionMenuApp", parent: ttk.Notebook) -> ttk.Frame:
     form.pack(fill=tk.X)
 
     ttk.Label(form, text="Action description").grid(row=0, column=0, sticky=tk.W, pady=3)
-    app.action_entry = ttk.Entry(form)
+    app.action_var = tk.StringVar(app, value=ACTION_SAMPLE)
+    app.action_entry = ttk.Entry(form, textvariable=app.action_var)
     app.action_entry.grid(row=0, column=1, sticky=tk.EW, padx=6, pady=3)
-    app.action_entry.insert(0, ACTION_SAMPLE)
-    app.action_entry.select_range(0, tk.END)
+    _select_sample_on_focus(app.action_entry, ACTION_SAMPLE)
     app._bind_submit(app.action_entry, app._add_weekly_action)
     form.columnconfigure(1, weight=1)
 
     ttk.Label(form, text="Timeframe").grid(row=1, column=0, sticky=tk.W, pady=3)
-    app.action_timeframe = ttk.Combobox(form, values=list(app.state.weekly_actions.keys()), state="readonly")
+    app.action_timeframe_var = tk.StringVar(app)
+    app.action_timeframe = ttk.Combobox(
+        form,
+        values=WEEKLY_BUCKETS,
+        textvariable=app.action_timeframe_var,
+        state="readonly",
+    )
     app.action_timeframe.current(0)
     app.action_timeframe.grid(row=1, column=1, sticky=tk.EW, padx=6, pady=3)
 
     ttk.Label(form, text="Motivation (goal / habit)").grid(row=2, column=0, sticky=tk.W, pady=3)
-    app.action_motivation = ttk.Combobox(form, state="readonly")
+    app.action_motivation_var = tk.StringVar(app)
+    app.action_motivation = ttk.Combobox(form, textvariable=app.action_motivation_var, state="readonly")
     app.action_motivation.grid(row=2, column=1, sticky=tk.EW, padx=6, pady=3)
 
     ttk.Button(form, text="Add to weekly menu", command=app._add_weekly_action).grid(row=3, column=1, sticky=tk.E, pady=8)
@@ -223,14 +337,14 @@ def build_weekly_tab(app: "ActionMenuApp", parent: ttk.Notebook) -> ttk.Frame:
     board.columnconfigure((0, 1, 2), weight=1)
 
     app.week_lists = {}
-    for idx, bucket in enumerate(app.state.weekly_actions):
+    for idx, bucket in enumerate(WEEKLY_BUCKETS):
         frame = ttk.Labelframe(board, text=bucket, padding=6)
         frame.grid(row=0, column=idx, sticky="nsew", padx=6)
-        listbox = tk.Listbox(frame, height=12)
+        listbox = VirtualListbox(frame, height=12)
         listbox.pack(fill=tk.BOTH, expand=True)
         app.week_lists[bucket] = listbox
         app._attach_tooltip(
-            listbox,
+            listbox.canvas,
             "Drop actions into this bucket. Drag-and-drop isn't enabled yet, so use the form above to add items.",
         )
 
@@ -247,7 +361,7 @@ def build_weekly_tab(app: "ActionMenuApp", parent: ttk.Notebook) -> ttk.Frame:
     return tab
 
 
-def build_time_tab(app: "ActionMenuApp", parent: ttk.Notebook) -> ttk.Frame:
+def build_time_tab(app: "ActionMenuApp", parent: ttk.Frame) -> ttk.Frame:
     tab = ttk.Frame(parent, padding=20)
 
     ttk.Label(
@@ -260,10 +374,10 @@ def build_time_tab(app: "ActionMenuApp", parent: ttk.Notebook) -> ttk.Frame:
     form.pack(fill=tk.X)
 
     ttk.Label(form, text="Activity / experiment").grid(row=0, column=0, sticky=tk.W, pady=3)
-    app.timer_activity = ttk.Entry(form)
+    app.timer_activity_var = tk.StringVar(app, value=TIMER_ACTIVITY_SAMPLE)
+    app.timer_activity = ttk.Entry(form, textvariable=app.timer_activity_var)
     app.timer_activity.grid(row=0, column=1, sticky=tk.EW, padx=6, pady=3)
-    app.timer_activity.insert(0, TIMER_ACTIVITY_SAMPLE)
-    app.timer_activity.select_range(0, tk.END)
+    _select_sample_on_focus(app.timer_activity, TIMER_ACTIVITY_SAMPLE)
     form.columnconfigure(1, weight=1)
 
     ttk.Label(form, text="Category").grid(row=1, column=0, sticky=tk.W, pady=3)
@@ -278,8 +392,11 @@ def build_time_tab(app: "ActionMenuApp", parent: ttk.Notebook) -> ttk.Frame:
     mood_frame = ttk.Frame(form)
     mood_frame.grid(row=2, column=0, columnspan=2, sticky=tk.EW, pady=6)
     ttk.Label(mood_frame, text="Flow before block (1-5)").grid(row=0, column=0, sticky=tk.W)
-    app.flow_before_var = tk.IntVar(value=3)
-    flow_scale = ttk.Scale(mood_frame, from_=1, to=5, orient=tk.HORIZONTAL, variable=app.flow_before_var)
+    # No variable= link: the drag only moves the slider (snapped to a whole step on release), and
+    # the value is read from the scale itself when a block starts, so key presses count too.
+    app.flow_scale = flow_scale = ttk.Scale(mood_frame, from_=1, to=5, orient=tk.HORIZONTAL)
+    flow_scale.set(3)
+    flow_scale.bind("<ButtonRelease-1>", lambda _event: _snap_scale(flow_scale), add="+")
     flow_scale.grid(row=0, column=1, sticky=tk.EW, padx=6)
     app._attach_tooltip(flow_scale, "How ready or focused do you feel right now? 1 = scattered, 5 = peak flow.")
     mood_frame.columnconfigure(1, weight=1)
@@ -300,21 +417,10 @@ def build_time_tab(app: "ActionMenuApp", parent: ttk.Notebook) -> ttk.Frame:
     status_label.pack(anchor=tk.W, pady=(10, 0))
     app._attach_tooltip(status_label, "Displays whether a block is actively running or logged.")
 
-    app.time_tree = ttk.Treeview(
-        tab,
-        columns=("activity", "category", "start", "duration", "color"),
-        show="headings",
-        height=10,
-    )
-    for col, label in zip(
-        ("activity", "category", "start", "duration", "color"),
-        ("Activity", "Category", "Start", "Hours", "Calendar tag"),
-    ):
-        anchor = tk.CENTER if col in {"category", "duration", "color"} else tk.W
-        width = 120 if col not in {"activity", "color"} else (260 if col == "activity" else 140)
-        app.time_tree.heading(col, text=label)
-        app.time_tree.column(col, anchor=anchor, width=width)
-    app.time_tree.pack(fill=tk.BOTH, expand=True, pady=12)
+    holder, app.time_tree, app.time_view = _virtual_tree(tab, _TIME_COLUMNS, height=10)
+    holder.pack(fill=tk.BOTH, expand=True, pady=(12, 4))
+    app.time_older_button = ttk.Button(tab, text="Load older entries", command=app._load_older_time_entries)
+    app.time_older_button.pack(anchor=tk.E, pady=(0, 8))
     app._attach_tooltip(
         app.time_tree,
         "Each entry includes color tags that align with categories—perfect for calendar exports later.",
@@ -326,21 +432,8 @@ def build_time_tab(app: "ActionMenuApp", parent: ttk.Notebook) -> ttk.Frame:
     app.flow_summary = tk.StringVar(value="Flow data pending first log.")
     ttk.Label(tab, textvariable=app.flow_summary, wraplength=900).pack(anchor=tk.W, pady=(4, 0))
 
-    app.flow_log_tree = ttk.Treeview(
-        tab,
-        columns=("activity", "before", "after", "emotion", "created"),
-        show="headings",
-        height=6,
-    )
-    for col, label in zip(
-        ("activity", "before", "after", "emotion", "created"),
-        ("Block", "Flow before", "Flow after", "Emotion after", "Logged"),
-    ):
-        anchor = tk.CENTER if col != "activity" else tk.W
-        width = 120 if col != "activity" else 240
-        app.flow_log_tree.heading(col, text=label)
-        app.flow_log_tree.column(col, anchor=anchor, width=width)
-    app.flow_log_tree.pack(fill=tk.BOTH, expand=True, pady=(6, 0))
+    holder, app.flow_log_tree, app.flow_log_view = _virtual_tree(tab, _FLOW_LOG_COLUMNS, height=6)
+    holder.pack(fill=tk.BOTH, expand=True, pady=(6, 0))
     app._attach_tooltip(
         app.flow_log_tree,
         "Logging after-action flow + emotion reveals what work gives energy. Fill it in after each block.",
@@ -350,7 +443,8 @@ def build_time_tab(app: "ActionMenuApp", parent: ttk.Notebook) -> ttk.Frame:
     custom_cat.pack(fill=tk.X, pady=(8, 0))
     ttk.Label(custom_cat, text="Add a category that matches your work vocabulary").grid(row=0, column=0, columnspan=2, sticky=tk.W)
     ttk.Label(custom_cat, text="Name").grid(row=1, column=0, sticky=tk.W, pady=(6, 0))
-    app.new_timer_category = ttk.Entry(custom_cat)
+    app.new_timer_category_var = tk.StringVar(app)
+    app.new_timer_category = ttk.Entry(custom_cat, textvariable=app.new_timer_category_var)
     app.new_timer_category.grid(row=1, column=1, sticky=tk.EW, padx=6, pady=(6, 0))
     custom_cat.columnconfigure(1, weight=1)
     ttk.Button(custom_cat, text="Add category", command=app._add_timer_category).grid(row=2, column=1, sticky=tk.E, pady=6)
@@ -363,7 +457,7 @@ def build_time_tab(app: "ActionMenuApp", parent: ttk.Notebook) -> ttk.Frame:
     return tab
 
 
-def build_journal_tab(app: "ActionMenuApp", parent: ttk.Notebook) -> ttk.Frame:
+def build_journal_tab(app: "ActionMenuApp", parent: ttk.Frame) -> ttk.Frame:
     tab = ttk.Frame(parent, padding=20)
 
     ttk.Label(
@@ -382,7 +476,7 @@ def build_journal_tab(app: "ActionMenuApp", parent: ttk.Notebook) -> ttk.Frame:
     ttk.Label(left, text="Daily journal (What happened today, anyway?)").pack(anchor=tk.W)
     app.journal_text = tk.Text(left, height=12, wrap=tk.WORD)
     app.journal_text.pack(fill=tk.BOTH, expand=True, pady=6)
-    app.journal_text.bind("<KeyRelease>", lambda _event: app._update_journal_suggestions())
+    app.journal_text.bind("<<Modified>>", lambda _event: app._on_journal_modified())
     app._attach_tooltip(
         app.journal_text,
         "Write freely; keywords like 'want to' or 'today' trigger suggestions automatically.",
@@ -407,18 +501,11 @@ def build_journal_tab(app: "ActionMenuApp", parent: ttk.Notebook) -> ttk.Frame:
     ttk.Button(btns, text="Quick capture", command=app._suggestion_to_capture).grid(row=0, column=3, padx=4)
 
     ttk.Label(right, text="Journal history").pack(anchor=tk.W)
-    app.journal_history = ttk.Treeview(
-        right,
-        columns=("timestamp", "excerpt"),
-        show="headings",
-        height=8,
-    )
-    app.journal_history.heading("timestamp", text="Captured")
-    app.journal_history.heading("excerpt", text="Excerpt")
-    app.journal_history.column("timestamp", width=140, anchor=tk.CENTER)
-    app.journal_history.column("excerpt", width=240, anchor=tk.W)
-    app.journal_history.pack(fill=tk.BOTH, expand=True)
-    app.journal_history.bind("<<TreeviewSelect>>", app._on_journal_select)
+    holder, app.journal_history, app.journal_view = _virtual_tree(right, _JOURNAL_COLUMNS, height=8)
+    holder.pack(fill=tk.BOTH, expand=True)
+    app.journal_older_button = ttk.Button(right, text="Load older entries", command=app._load_older_journal_entries)
+    app.journal_older_button.pack(anchor=tk.E, pady=(4, 0))
+    app.journal_history.bind("<<TreeviewSelect>>", app._on_journal_select, add="+")
     app._attach_tooltip(
         app.journal_history,
         "Tap any row to reload that entry's text and suggestions.",
@@ -428,12 +515,10 @@ def build_journal_tab(app: "ActionMenuApp", parent: ttk.Notebook) -> ttk.Frame:
     app.journal_detail.configure(state=tk.DISABLED)
     app.journal_detail.pack(fill=tk.X, pady=(10, 0))
 
-    app._update_journal_suggestions()
-
     return tab
 
 
-def build_quick_capture_tab(app: "ActionMenuApp", parent: ttk.Notebook) -> ttk.Frame:
+def build_quick_capture_tab(app: "ActionMenuApp", parent: ttk.Frame) -> ttk.Frame:
     tab = ttk.Frame(parent, padding=20)
 
     ttk.Label(
@@ -445,10 +530,10 @@ def build_quick_capture_tab(app: "ActionMenuApp", parent: ttk.Notebook) -> ttk.F
     entry_frame = ttk.Frame(tab)
     entry_frame.pack(fill=tk.X)
     ttk.Label(entry_frame, text="Drop a thought, task, or idea:").grid(row=0, column=0, sticky=tk.W)
-    app.quick_entry = ttk.Entry(entry_frame)
+    app.quick_entry_var = tk.StringVar(app, value=QUICK_ENTRY_SAMPLE)
+    app.quick_entry = ttk.Entry(entry_frame, textvariable=app.quick_entry_var)
     app.quick_entry.grid(row=0, column=1, sticky=tk.EW, padx=6)
-    app.quick_entry.insert(0, QUICK_ENTRY_SAMPLE)
-    app.quick_entry.select_range(0, tk.END)
+    _select_sample_on_focus(app.quick_entry, QUICK_ENTRY_SAMPLE)
     app._bind_submit(app.quick_entry, app._add_quick_item)
     entry_frame.columnconfigure(1, weight=1)
     ttk.Button(entry_frame, text="Capture", command=app._add_quick_item).grid(row=0, column=2)
@@ -458,19 +543,8 @@ def build_quick_capture_tab(app: "ActionMenuApp", parent: ttk.Notebook) -> ttk.F
     )
 
     ttk.Label(tab, text="Inbox → Today → Later → Archived").pack(anchor=tk.W, pady=(10, 0))
-    app.quick_tree = ttk.Treeview(
-        tab,
-        columns=("text", "status", "created"),
-        show="headings",
-        height=12,
-    )
-    app.quick_tree.heading("text", text="Item")
-    app.quick_tree.heading("status", text="Status")
-    app.quick_tree.heading("created", text="Captured")
-    app.quick_tree.column("text", width=360, anchor=tk.W)
-    app.quick_tree.column("status", width=100, anchor=tk.CENTER)
-    app.quick_tree.column("created", width=140, anchor=tk.CENTER)
-    app.quick_tree.pack(fill=tk.BOTH, expand=True, pady=8)
+    holder, app.quick_tree, app.quick_view = _virtual_tree(tab, _QUICK_CAPTURE_COLUMNS, height=12)
+    holder.pack(fill=tk.BOTH, expand=True, pady=8)
     app._attach_tooltip(
         app.quick_tree,
         "Select one or more entries, then use the buttons below to pin to Today, schedule Later, archive, edit, or delete.",
@@ -490,16 +564,11 @@ def build_quick_capture_tab(app: "ActionMenuApp", parent: ttk.Notebook) -> ttk.F
     return tab
 
 
-def build_integrations_tab(app: "ActionMenuApp", parent: ttk.Notebook) -> ttk.Frame:
+def build_integrations_tab(app: "ActionMenuApp", parent: ttk.Frame) -> ttk.Frame:
     tab = ttk.Frame(parent, padding=20)
 
     ttk.Label(tab, text="Prototype integrations", font=("Segoe UI", 14, "bold")).pack(anchor=tk.W)
-    info = (
-        "Export weekly plan to Google Calendar",
-        "Sync time blocks with wearable or health data",
-        "Push habit reminders via email or mobile notifications",
-    )
-    ttk.Label(tab, text="\n".join(f"• {line}" for line in info)).pack(anchor=tk.W, pady=10)
+    ttk.Label(tab, text=_INTEGRATIONS_INFO_BLOCK).pack(anchor=tk.W, pady=10)
 
     ttk.Button(tab, text="Mock Google Calendar connect", command=app._mock_calendar_connect).pack(anchor=tk.W)
     ttk.Label(
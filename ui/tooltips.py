@@ -1,42 +1,88 @@
 """Reusable tooltip widget for Tkinter."""
 from __future__ import annotations
 
+from typing import Dict, Tuple
 import tkinter as tk
 
+# One shared copy per distinct tooltip text, however many widgets register it.
+_TOOLTIP_INTERN: Dict[str, str] = {}
 
-class Tooltip:
-    """Simple tooltip implementation that appears near the target widget."""
 
-    def __init__(self, widget: tk.Widget, text: str) -> None:
-        self.widget = widget
-        self.text = text
-        self.tipwindow: tk.Toplevel | None = None
-        widget.bind("<Enter>", self._show)
-        widget.bind("<Leave>", self._hide)
-        widget.bind("<FocusOut>", self._hide)
+class TooltipManager:
+    """Shows tooltips for every registered widget through one set of app-wide bindings.
 
-    def _show(self, _event: tk.Event | None = None) -> None:
-        if self.tipwindow or not self.text:
+    Widgets are registered by path name, so attaching a tooltip adds no bindings of its own.
+    A tip appears once the pointer has rested on its widget for ``SHOW_DELAY_MS`` and reuses a
+    single withdrawn popup that is relabelled and moved, never recreated.
+    """
+
+    SHOW_DELAY_MS = 400
+
+    def __init__(self, root: tk.Tk) -> None:
+        self._root = root
+        self._texts: Dict[str, str] = {}
+        self._popup: Tuple[tk.Toplevel, tk.Label] | None = None
+        self._owner: str | None = None
+        self._pending: Tuple[str, str] | None = None
+        root.bind_all("<Enter>", self._on_enter, add="+")
+        root.bind_all("<Leave>", self._on_leave, add="+")
+        root.bind_all("<FocusOut>", self._on_leave, add="+")
+
+    def attach(self, widget: tk.Widget, text: str) -> None:
+        if text:
+            self._texts[str(widget)] = _TOOLTIP_INTERN.setdefault(text, text)
+
+    def _on_enter(self, event: tk.Event) -> None:
+        path = str(event.widget)
+        if path not in self._texts or path == self._owner:
             return
-        x = self.widget.winfo_rootx() + 12
-        y = self.widget.winfo_rooty() + self.widget.winfo_height() + 6
-        self.tipwindow = tk.Toplevel(self.widget)
-        self.tipwindow.wm_overrideredirect(True)
-        self.tipwindow.wm_geometry(f"+{x}+{y}")
-        label = tk.Label(
-            self.tipwindow,
-            text=self.text,
-            justify=tk.LEFT,
-            background="#ffffe0",
-            relief=tk.SOLID,
-            borderwidth=1,
-            padx=6,
-            pady=3,
-            wraplength=260,
-        )
-        label.pack()
-
-    def _hide(self, _event: tk.Event | None = None) -> None:
-        if self.tipwindow is not None:
-            self.tipwindow.destroy()
-            self.tipwindow = None
+        self._cancel_pending()
+        # Hover intent: sweeping the pointer across the UI never shows (or flashes) a tip.
+        self._pending = (path, self._root.after(self.SHOW_DELAY_MS, lambda: self._show(path)))
+
+    def _on_leave(self, event: tk.Event) -> None:
+        path = str(event.widget)
+        if self._pending is not None and self._pending[0] == path:
+            self._cancel_pending()
+        if path == self._owner:
+            self._owner = None
+            if self._popup is not None:
+                self._popup[0].withdraw()
+
+    def _cancel_pending(self) -> None:
+        if self._pending is not None:
+            self._root.after_cancel(self._pending[1])
+            self._pending = None
+
+    def _show(self, path: str) -> None:
+        self._pending = None
+        try:
+            widget = self._root.nametowidget(path)
+        except KeyError:
+            return  # Destroyed while the delay was running.
+        window, label = self._shared_popup()
+        label.configure(text=self._texts[path])
+        x = widget.winfo_rootx() + 12
+        y = widget.winfo_rooty() + widget.winfo_height() + 6
+        window.wm_geometry(f"+{x}+{y}")
+        window.deiconify()
+        self._owner = path
+
+    def _shared_popup(self) -> Tuple[tk.Toplevel, tk.Label]:
+        if self._popup is None:
+            window = tk.Toplevel(self._root)
+            window.withdraw()
+            window.wm_overrideredirect(True)
+            label = tk.Label(
+                window,
+                justify=tk.LEFT,
+                background="#ffffe0",
+                relief=tk.SOLID,
+                borderwidth=1,
+                padx=6,
+                pady=3,
+                wraplength=260,
+            )
+            label.pack()
+            self._popup = (window, label)
+        return self._popup
@@ -0,0 +1,72 @@
+"""Canvas-backed list that only draws the rows in view."""
+from __future__ import annotations
+
+from typing import Iterable, List
+import tkinter as tk
+from tkinter import font as tkfont
+from tkinter import ttk
+
+
+class VirtualListbox(ttk.Frame):
+    """Read-only list for long bucket contents; scrolling and updates cost O(visible rows)."""
+
+    def __init__(self, parent: tk.Widget, *, height: int = 10) -> None:
+        super().__init__(parent)
+        self._items: List[str] = []
+        self._font = tkfont.nametofont("TkDefaultFont")
+        self._row_height = self._font.metrics("linespace") + 2
+
+        self.canvas = tk.Canvas(
+            self,
+            height=height * self._row_height,
+            background=ttk.Style(self).lookup("Treeview", "fieldbackground") or "white",
+            highlightthickness=1,
+            highlightbackground="#c8c8c8",
+            borderwidth=0,
+        )
+        self._scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self.canvas.yview)
+        self.canvas.configure(yscrollcommand=self._on_yscroll, yscrollincrement=self._row_height)
+        self._scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        self.canvas.bind("<Configure>", lambda _event: self._redraw())
+        self.canvas.bind("<MouseWheel>", lambda event: self._scroll(-1 if event.delta > 0 else 1))
+        self.canvas.bind("<Button-4>", lambda _event: self._scroll(-1))
+        self.canvas.bind("<Button-5>", lambda _event: self._scroll(1))
+
+    def set_items(self, items: Iterable[str]) -> None:
+        self._items = list(items)
+        self._update_region()
+
+    def append(self, item: str) -> None:
+        self._items.append(item)
+        self._update_region()
+
+    def _update_region(self) -> None:
+        # No direct redraw: configuring the region makes the canvas report its yview on the next
+        # idle pass (even when the fractions are unchanged), and _on_yscroll redraws from there.
+        self.canvas.configure(scrollregion=(0, 0, 0, len(self._items) * self._row_height))
+
+    def _on_yscroll(self, first: str, last: str) -> None:
+        self._scrollbar.set(first, last)
+        self._redraw()
+
+    def _scroll(self, units: int) -> str:
+        self.canvas.yview_scroll(units * 3, "units")
+        return "break"
+
+    def _redraw(self) -> None:
+        canvas = self.canvas
+        canvas.delete("row")
+        top = int(canvas.canvasy(0))
+        first = max(0, top // self._row_height)
+        last = min(len(self._items), (top + canvas.winfo_height()) // self._row_height + 1)
+        for index in range(first, last):
+            canvas.create_text(
+                4,
+                index * self._row_height + 1,
+                text=self._items[index],
+                anchor=tk.NW,
+                font=self._font,
+                tags="row",
+            )
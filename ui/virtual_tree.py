@@ -0,0 +1,238 @@
+"""Windowed rendering for ttk.Treeview."""
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Tuple
+import tkinter as tk
+from tkinter import ttk
+
+Row = Tuple[str, Tuple[object, ...]]
+# Shift and Control bits of an event's state mask.
+_EXTEND_MODIFIERS = 0x0001 | 0x0004
+
+
+class VirtualTreeview:
+    """Keeps every row in Python and only materializes the visible window in the Treeview.
+
+    The tree itself never scrolls: the external scrollbar, the mouse wheel and Up/Down at the
+    window edges move the window instead. Selection and focus are tracked here by row id, so they
+    survive rows leaving and re-entering the window; read them through ``selection()``.
+    """
+
+    WHEEL_STEP = 3
+
+    def __init__(self, tree: ttk.Treeview, scrollbar: ttk.Scrollbar) -> None:
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self._ids: List[str] = []
+        self._values: Dict[str, Tuple[object, ...]] = {}
+        self._rendered: List[str] = []
+        # Values as last sent to Tk, so unchanged rows cost no Tcl call on refresh.
+        self._shown: Dict[str, Tuple[object, ...]] = {}
+        self._offset = 0
+        # Estimated from the height option until a rendered row can be measured (see _render).
+        self._visible = int(tree.cget("height"))
+        self._measured = False
+        self._remeasure_id: str | None = None
+        self._selection: List[str] = []
+        self._focus = ""
+        self._extending = False
+
+        scrollbar.configure(command=self._on_scrollbar)
+        tree.bind("<Configure>", self._on_configure, add="+")
+        tree.bind("<MouseWheel>", self._on_wheel)
+        tree.bind("<Button-4>", lambda _event: self._scroll_and_break(-self.WHEEL_STEP))
+        tree.bind("<Button-5>", lambda _event: self._scroll_and_break(self.WHEEL_STEP))
+        tree.bind("<Up>", lambda event: self._on_arrow(event, -1))
+        tree.bind("<Down>", lambda event: self._on_arrow(event, 1))
+        # The class bindings scroll the Treeview itself, which only ever holds the window.
+        tree.bind("<Prior>", lambda event: self._on_page(event, -self._visible))
+        tree.bind("<Next>", lambda event: self._on_page(event, self._visible))
+        tree.bind("<Home>", lambda event: self._on_page(event, -len(self._ids)))
+        tree.bind("<End>", lambda event: self._on_page(event, len(self._ids)))
+        tree.bind("<<TreeviewSelect>>", self._on_select, add="+")
+        tree.bind("<ButtonPress-1>", self._note_modifiers, add="+")
+        tree.bind("<KeyPress>", self._note_modifiers, add="+")
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def selection(self) -> Tuple[str, ...]:
+        """Selected row ids, including rows currently scrolled out of the window."""
+        return tuple(self._selection)
+
+    def set_rows(self, rows: Iterable[Row]) -> None:
+        # dict() consumes the (iid, values) pairs in C and keeps their order; the ids are its keys.
+        self._values = dict(rows)
+        self._ids = list(self._values)
+        self._selection = [iid for iid in self._selection if iid in self._values]
+        self._render(refresh_values=True)
+
+    def insert(self, index: int | str, iid: str, values: Tuple[object, ...]) -> None:
+        if index == tk.END:
+            self._ids.append(iid)
+        else:
+            self._ids.insert(int(index), iid)
+        self._values[iid] = values
+        self._render()
+
+    def update(self, iid: str, values: Tuple[object, ...]) -> None:
+        if iid not in self._values:
+            return
+        self._values[iid] = values
+        if iid in self._shown:
+            self._show_values(iid, values)
+
+    def remove(self, iids: Iterable[str]) -> None:
+        doomed = {iid for iid in iids if iid in self._values}
+        if not doomed:
+            return
+        self._ids = [iid for iid in self._ids if iid not in doomed]
+        self._selection = [iid for iid in self._selection if iid not in doomed]
+        for iid in doomed:
+            del self._values[iid]
+        self._render()
+
+    def _render(self, *, refresh_values: bool = False) -> None:
+        focus = self.tree.focus()
+        if focus:
+            self._focus = focus
+        self._offset = max(0, min(self._offset, len(self._ids) - self._visible))
+        window = self._ids[self._offset : self._offset + self._visible]
+        wanted = set(window)
+        stale = [iid for iid in self._rendered if iid not in wanted]
+        if stale:
+            self.tree.delete(*stale)
+            for iid in stale:
+                del self._shown[iid]
+        kept = [iid for iid in self._rendered if iid in wanted]
+        kept_set = set(kept)
+        if kept != [iid for iid in window if iid in kept_set]:
+            # The model was reordered; rebuilding a viewport's worth of rows beats moving them one by one.
+            self.tree.delete(*kept)
+            self._shown.clear()
+            kept_set = set()
+        elif refresh_values:
+            for iid in kept:
+                self._show_values(iid, self._values[iid])
+        for index, iid in enumerate(window):
+            if iid not in kept_set:
+                self._tree_insert(index, iid, self._values[iid])
+        self._rendered = window
+        self._restore_selection(wanted)
+        self._update_scrollbar()
+        if not self._measured and window and self._remeasure_id is None:
+            # A <Configure> that arrived while the tree was empty could not measure a row; do it
+            # once the first rows have been laid out.
+            self._remeasure_id = self.tree.after_idle(self._remeasure)
+
+    def _restore_selection(self, wanted: set[str]) -> None:
+        # Rebuilt rows come back unselected; re-apply the remembered selection and focus to them.
+        shown = [iid for iid in self._selection if iid in wanted]
+        if set(shown) != set(self.tree.selection()):
+            self.tree.selection_set(shown)
+        if self._focus in wanted and self.tree.focus() != self._focus:
+            self.tree.focus(self._focus)
+
+    def _on_select(self, _event: tk.Event) -> None:
+        # Also fires (later, from the event queue) for the selection changes _render makes itself;
+        # those already match the remembered selection and are ignored.
+        visible = set(self.tree.selection())
+        rendered = set(self._rendered)
+        expected = {iid for iid in self._selection if iid in rendered}
+        if visible == expected:
+            return
+        focus = self.tree.focus()
+        if focus:
+            self._focus = focus
+        # Shift/Ctrl extend or trim the selection and keep off-screen picks; anything else replaced it.
+        offscreen = [iid for iid in self._selection if iid not in rendered] if self._extending else []
+        self._selection = offscreen + [iid for iid in self._rendered if iid in visible]
+
+    def _note_modifiers(self, event: tk.Event) -> None:
+        self._extending = bool(event.state & _EXTEND_MODIFIERS)
+
+    def _tree_insert(self, index: int, iid: str, values: Tuple[object, ...]) -> None:
+        # Same Tcl command Treeview.insert emits, minus its option-dict formatting.
+        self.tree.tk.call(self.tree._w, "insert", "", index, "-id", iid, "-values", values)
+        self._shown[iid] = values
+
+    def _show_values(self, iid: str, values: Tuple[object, ...]) -> None:
+        if self._shown.get(iid) != values:
+            self.tree.item(iid, values=values)
+            self._shown[iid] = values
+
+    def _update_scrollbar(self) -> None:
+        total = len(self._ids)
+        if not total:
+            self.scrollbar.set(0.0, 1.0)
+            return
+        self.scrollbar.set(self._offset / total, min(1.0, (self._offset + len(self._rendered)) / total))
+
+    def _scroll_to(self, offset: int) -> bool:
+        offset = max(0, min(offset, len(self._ids) - self._visible))
+        if offset == self._offset:
+            return False
+        self._offset = offset
+        self._render()
+        return True
+
+    def _on_scrollbar(self, *args: str) -> None:
+        if args[0] == "moveto":
+            self._scroll_to(round(float(args[1]) * len(self._ids)))
+        elif args[0] == "scroll":
+            step = int(args[1]) * (self._visible if args[2] == "pages" else 1)
+            self._scroll_to(self._offset + step)
+
+    def _scroll_and_break(self, step: int) -> str:
+        self._scroll_to(self._offset + step)
+        return "break"
+
+    def _on_wheel(self, event: tk.Event) -> str:
+        return self._scroll_and_break(-self.WHEEL_STEP if event.delta > 0 else self.WHEEL_STEP)
+
+    def _on_arrow(self, event: tk.Event, step: int) -> str | None:
+        # Key-specific bindings shadow the generic <KeyPress> one, so note the modifiers here too.
+        self._note_modifiers(event)
+        if not self._rendered:
+            return None
+        edge = self._rendered[-1] if step > 0 else self._rendered[0]
+        if self.tree.focus() != edge or not self._scroll_to(self._offset + step):
+            return None
+        self._select_edge(step)
+        return "break"
+
+    def _on_page(self, event: tk.Event, step: int) -> str:
+        self._note_modifiers(event)
+        if self._rendered:
+            self._scroll_to(self._offset + step)
+            self._select_edge(step)
+        return "break"
+
+    def _select_edge(self, step: int) -> None:
+        target = self._rendered[-1] if step > 0 else self._rendered[0]
+        self.tree.focus(target)
+        self.tree.selection_set(target)
+
+    def _on_configure(self, event: tk.Event) -> None:
+        # Only the window size decides how many rows exist in Tk; the requested height option
+        # never changes, so inserts and deletes don't trigger a geometry pass of their own.
+        visible = self._measure_visible(event.height)
+        if visible != self._visible:
+            self._visible = visible
+            self._render()
+
+    def _remeasure(self) -> None:
+        self._remeasure_id = None
+        visible = self._measure_visible(self.tree.winfo_height())
+        if visible != self._visible:
+            self._visible = visible
+            self._render()
+
+    def _measure_visible(self, tree_height: int) -> int:
+        if self._rendered:
+            bbox = self.tree.bbox(self._rendered[0])
+            if bbox:
+                self._measured = True
+                _x, top, _width, row_height = bbox
+                return max(1, (tree_height - top) // row_height)
+        return self._visible